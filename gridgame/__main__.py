@@ -1,23 +1,21 @@
 import argparse
+import asyncio
+
+from functools import partial
 
 from .view import View
 from .controller import Controller
-
-from .model import (
-    GridGameModel,
+from .policies import random_policy
+from .simulation import simulate
+from .server import GameServer
+from .benchmark import (
+    compare_results,
+    read_results,
+    run_benchmark,
+    write_results,
     )
 
-from .tictactoe import (
-    TicTacToeSymbolAndPlayerHandler,
-    TicTacToeWinChecker,
-    TicTacToeSettingInitializer,
-    )
-
-from .notakto import (
-    NotaktoSettingInitializer,
-    NotaktoSymbolAndPlayerHandler,
-    NotaktoWinChecker,
-    )
+from .variants import make_model
 
 def str_list(line: str) -> list[str]:
     return line.split(',')
@@ -25,67 +23,169 @@ def str_list(line: str) -> list[str]:
 def setup_parser():
     parser = argparse.ArgumentParser()
 
+    parser.add_argument(
+        'command',
+        nargs='?',
+        choices=["play", "simulate", "bench", "serve"],
+        default="play",
+    )
     parser.add_argument('-n', '--size', type=int, default=3)
     parser.add_argument('-p', '--player_count', type=int, default=2)
     parser.add_argument(
         '--variant',
         choices=["tictactoe", "notakto", "wild", "pick15"],
-        required=True,
     )
     parser.add_argument('-s', '--symbols', type=str_list, default=[])
+    parser.add_argument(
+        '--field',
+        choices=["dict", "bitboard", "array"],
+        default="dict",
+    )
 
-    return parser
-
+    # simulate
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--policy', choices=["random"], default="random")
+    parser.add_argument('--seed', type=int, default=None)
 
-def make_model(args: argparse.Namespace):
+    # bench
+    parser.add_argument(
+        '--variants',
+        type=str_list,
+        default=["tictactoe", "notakto"],
+    )
+    parser.add_argument(
+        '--sizes',
+        type=lambda line: [int(size) for size in str_list(line)],
+        default=[3, 5, 10, 25, 50, 100],
+    )
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('-o', '--output', type=str, default='bench_output.json')
+    parser.add_argument(
+        '--compare',
+        nargs=2,
+        metavar=('BASELINE', 'CANDIDATE'),
+        default=None,
+    )
 
-    size = args.size
-    player_count = args.player_count
-    player_symbols = args.symbols
+    # serve
+    parser.add_argument('--host', type=str, default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--idle_timeout', type=float, default=300.0)
+    parser.add_argument('--max_sessions', type=int, default=10000)
 
-    match args.variant:
-        case "tictactoe":
+    return parser
 
-            symbol_and_player_handler = TicTacToeSymbolAndPlayerHandler
-            win_checker = TicTacToeWinChecker
-            gamemode = TicTacToeSettingInitializer
 
-        case "notakto":
-            # raise NotImplementedError('notakto variant is not yet implemented')
-            
-            symbol_and_player_handler = NotaktoSymbolAndPlayerHandler
-            win_checker = NotaktoWinChecker
-            gamemode = NotaktoSettingInitializer
+def run_simulation(args: argparse.Namespace):
+    match args.policy:
+        case "random":
+            policy = random_policy
 
+        case _:
+            raise NotImplementedError(f'Policy "{args.policy}" is unknown')
 
-        case "wild":
-            raise NotImplementedError('wild variant is not yet implemented')
+    # Fail early on invalid settings instead of inside the workers
+    make_model(args)
 
-        case "pick15":
-            raise NotImplementedError('pick15 variant is not yet implemented')
+    report = simulate(
+        partial(make_model, args),
+        games=args.games,
+        workers=args.workers,
+        policy=policy,
+        seed=args.seed,
+    )
 
-        case _:
-            raise NotImplementedError(f'Variant "{args.variant}" is unknown')
+    print(f'Played {report.games} games in {report.seconds:.2f}s '
+          f'({report.games_per_second:.1f} games/s)')
+    for player in range(1, args.player_count + 1):
+        print(f'Player {player} wins: {report.win_rates.get(player, 0.0):.1%}')
+    print(f'Draws: {report.draw_rate:.1%}')
+
+
+def run_benchmarks(args: argparse.Namespace):
+    default_symbols = {
+        "tictactoe": ['X', 'O'],
+        "notakto": ['X'],
+    }
+
+    results = []
+    for variant in args.variants:
+        for size in args.sizes:
+            variant_args = argparse.Namespace(**{
+                **vars(args),
+                'variant': variant,
+                'size': size,
+                'player_count': 2,
+                'symbols': args.symbols or default_symbols.get(variant, []),
+            })
+            # Fail early on invalid settings
+            make_model(variant_args)
+
+            results += run_benchmark(
+                variant, size, partial(make_model, variant_args),
+                repeat=args.repeat,
+                seed=args.seed or 0,
+            )
+            print(f'{variant} n={size}: done')
+
+    write_results(args.output, results)
+    print(f'Wrote {len(results)} results to {args.output}')
+
+
+def run_comparison(args: argparse.Namespace):
+    baseline_path, candidate_path = args.compare
+
+    rows = compare_results(read_results(baseline_path), read_results(candidate_path))
+
+    print(f'{"variant":<10} {"n":>4} {"operation":<20} {"baseline":>12} {"candidate":>12} {"ratio":>7}')
+    for before, after, ratio in rows:
+        print(f'{after.variant:<10} {after.grid_size:>4} {after.operation:<20} '
+              f'{before.seconds_per_call * 1e6:>10.2f}us {after.seconds_per_call * 1e6:>10.2f}us '
+              f'{ratio:>6.2f}x')
+
+
+def run_server(args: argparse.Namespace):
+    server = GameServer(
+        make_model,
+        args,
+        idle_timeout=args.idle_timeout,
+        max_sessions=args.max_sessions,
+    )
 
-    return GridGameModel(
-        size,
-        player_symbols,
-        player_count,
-        symbol_and_player_handler,
-        win_checker,
-        gamemode
-        )
+    print(f'Serving games on {args.host}:{args.port}')
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
 
 
 def main():
     parser = setup_parser()
     args = parser.parse_args()
 
-    model = make_model(args)
-    view = View()
-    controller = Controller(model, view)
+    if args.command in ("play", "simulate") and args.variant is None:
+        parser.error(f'--variant is required for {args.command}')
+
+    match args.command:
+        case "simulate":
+            run_simulation(args)
+
+        case "bench" if args.compare is not None:
+            run_comparison(args)
+
+        case "bench":
+            run_benchmarks(args)
+
+        case "serve":
+            run_server(args)
+
+        case _:
+            model = make_model(args)
+            view = View()
+            controller = Controller(model, view)
 
-    controller.start_game()
+            controller.start_game()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,112 @@
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+
+from .project_types import Cell, Field, Symbol
+
+
+class ArrayField(Field):
+    """
+    `Field` stored as an n x n NumPy array of small integer symbol codes.
+
+    Code 0 marks an empty cell; symbols get codes 1, 2, ... in the order
+    they are first placed. Line checks are vectorized reductions over the
+    whole array, which pays off over the dict-backed `Field` for grid
+    sizes of about 50 and above.
+    """
+
+    def _init_storage(self):
+        grid_size = self._grid_size
+        self._board = np.zeros((grid_size, grid_size), dtype=np.uint8)
+        self._codes: dict[Symbol, int] = {}
+        self._symbols: list[Symbol | None] = [None]
+
+    def _copy_storage(self):
+        self._board = self._board.copy()
+        self._codes = dict(self._codes)
+        self._symbols = list(self._symbols)
+
+    def _code_of(self, symbol: Symbol) -> int:
+        if (code := self._codes.get(symbol)) is None:
+            code = self._codes[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+
+        return code
+
+    @property
+    def occupied_cells(self) -> Mapping[Cell, Symbol]:
+        rows, cols = np.nonzero(self._board)
+        cell = self._cell_table.cell
+
+        return {
+            cell(int(r) + 1, int(c) + 1): self._symbols[self._board[r, c]]
+            for r, c in zip(rows, cols)
+        }
+
+    def place_symbol(self, symbol: Symbol, cell: Cell):
+        assert self.is_within_bounds(cell)
+        self._own_storage()
+
+        previous = self.get_symbol_at(cell)
+        self._board[cell.row - 1, cell.col - 1] = self._code_of(symbol)
+        self._mark_occupied(cell, symbol, previous)
+
+    def clear_cell(self, cell: Cell):
+        if (previous := self.get_symbol_at(cell)) is None:
+            return
+
+        self._own_storage()
+        self._board[cell.row - 1, cell.col - 1] = 0
+        self._mark_unoccupied(cell, previous)
+
+    def get_symbol_at(self, cell: Cell) -> Symbol | None:
+        if not self.is_within_bounds(cell):
+            return None
+
+        return self._symbols[self._board[cell.row - 1, cell.col - 1]]
+
+    def are_all_equal_to_basis(self, basis: Symbol, group: Iterable[Cell]):
+        if (code := self._codes.get(basis)) is None:
+            return False
+
+        cells = list(group)
+        rows = np.fromiter((cell.row - 1 for cell in cells), dtype=np.intp, count=len(cells))
+        cols = np.fromiter((cell.col - 1 for cell in cells), dtype=np.intp, count=len(cells))
+
+        return bool((self._board[rows, cols] == code).all())
+
+    def is_line_filled_with(self, basis: Symbol, line: int) -> bool:
+        if (code := self._codes.get(basis)) is None:
+            return False
+
+        board = self._board
+        n = self._grid_size
+
+        if line < n:
+            values = board[line]
+        elif line < 2 * n:
+            values = board[:, line - n]
+        elif line == 2 * n:
+            values = np.diagonal(board)
+        else:
+            values = np.diagonal(np.fliplr(board))
+
+        return bool((values == code).all())
+
+    def completed_line_symbol(self) -> Symbol | None:
+        board = self._board
+
+        # Same order as `LineTable`: rows, columns, backslash, forward slash
+        full_rows = (board == board[:, :1]).all(axis=1) & (board[:, 0] != 0)
+        if full_rows.any():
+            return self._symbols[board[full_rows.argmax(), 0]]
+
+        full_cols = (board == board[:1, :]).all(axis=0) & (board[0, :] != 0)
+        if full_cols.any():
+            return self._symbols[board[0, full_cols.argmax()]]
+
+        for diagonal in (np.diagonal(board), np.diagonal(np.fliplr(board))):
+            if diagonal[0] != 0 and (diagonal == diagonal[0]).all():
+                return self._symbols[diagonal[0]]
+
+        return None
@@ -0,0 +1,174 @@
+import json
+import platform
+import random
+import time
+
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+
+from .model import GridGameModel
+from .project_types import Move
+from .policies import random_policy
+
+
+ModelFactory = Callable[[], GridGameModel]
+
+OPERATIONS = (
+    'construction',
+    'place_symbol',
+    'winner',
+    'is_game_over',
+    'has_unoccupied_cell',
+    'occupied_cells',
+)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    variant: str
+    grid_size: int
+    operation: str
+    calls: int
+    # Best over all repeats
+    seconds_per_call: float
+
+
+def _record_game(model_factory: ModelFactory, seed: int) -> list[Move]:
+    """Moves of one random game, replayed identically on every repeat."""
+    model = model_factory()
+    rng = random.Random(seed)
+    moves = []
+
+    while not model.is_game_over:
+        move = random_policy(model, rng)
+        model.place_symbol(*move)
+        moves.append(move)
+
+    return moves
+
+
+def _time_game(
+    model_factory: ModelFactory,
+    moves: list[Move],
+    calls: int,
+    ) -> dict[str, float]:
+    """Total seconds spent in each operation while replaying `moves`."""
+    clock = time.perf_counter
+    totals = dict.fromkeys(OPERATIONS, 0.0)
+
+    start = clock()
+    model = model_factory()
+    totals['construction'] = clock() - start
+
+    # `is_game_over` reads `winner`, and both are cached per version, so
+    # each is timed on its own copy of the game to measure a fresh result
+    twin = model_factory()
+
+    for symbol, cell in moves:
+        start = clock()
+        model.place_symbol(symbol, cell)
+        totals['place_symbol'] += clock() - start
+
+        start = clock()
+        model.winner
+        totals['winner'] += clock() - start
+
+        twin.place_symbol(symbol, cell)
+
+        start = clock()
+        twin.is_game_over
+        totals['is_game_over'] += clock() - start
+
+    # Board reads do not depend on the move, so time them in a tight loop
+    # on the final board
+    start = clock()
+    for _ in range(calls):
+        model.has_unoccupied_cell()
+    totals['has_unoccupied_cell'] = clock() - start
+
+    start = clock()
+    for _ in range(calls):
+        model.occupied_cells
+    totals['occupied_cells'] = clock() - start
+
+    return totals
+
+
+def run_benchmark(
+    variant: str,
+    grid_size: int,
+    model_factory: ModelFactory,
+    repeat: int = 3,
+    seed: int = 0,
+    field_calls: int = 1000,
+    ) -> list[BenchmarkResult]:
+    moves = _record_game(model_factory, seed)
+    call_counts = {
+        'construction': 1,
+        'place_symbol': len(moves),
+        'winner': len(moves),
+        'is_game_over': len(moves),
+        'has_unoccupied_cell': field_calls,
+        'occupied_cells': field_calls,
+    }
+
+    best = dict.fromkeys(OPERATIONS, float('inf'))
+    for _ in range(repeat):
+        totals = _time_game(model_factory, moves, field_calls)
+        for operation, seconds in totals.items():
+            best[operation] = min(best[operation], seconds)
+
+    return [
+        BenchmarkResult(
+            variant=variant,
+            grid_size=grid_size,
+            operation=operation,
+            calls=call_counts[operation],
+            seconds_per_call=best[operation] / call_counts[operation],
+        )
+        for operation in OPERATIONS
+    ]
+
+
+def write_results(path: str, results: Iterable[BenchmarkResult]) -> None:
+    document = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': [asdict(result) for result in results],
+    }
+
+    with open(path, 'w') as file:
+        json.dump(document, file, indent=2)
+
+
+def read_results(path: str) -> list[BenchmarkResult]:
+    with open(path) as file:
+        document = json.load(file)
+
+    return [BenchmarkResult(**result) for result in document['results']]
+
+
+def compare_results(
+    baseline: Iterable[BenchmarkResult],
+    candidate: Iterable[BenchmarkResult],
+    ) -> list[tuple[BenchmarkResult, BenchmarkResult, float]]:
+    """
+    Pairs up results of the same variant, grid size and operation.
+
+    Each entry carries the candidate / baseline time ratio: below 1 is a
+    speed-up, above 1 a slowdown.
+    """
+    def key(result: BenchmarkResult) -> tuple[str, int, str]:
+        return result.variant, result.grid_size, result.operation
+
+    baseline_by_key = {key(result): result for result in baseline}
+
+    return [
+        (before, after, (
+            after.seconds_per_call / before.seconds_per_call
+            if before.seconds_per_call > 0 else float('inf')
+        ))
+        for after in candidate
+        if (before := baseline_by_key.get(key(after))) is not None
+    ]
@@ -1,6 +1,144 @@
+import asyncio
+import random
+
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+
 from .model import GridGameModel
 from .view import View
-from .project_types import Feedback
+from .project_types import Cell, Feedback, Move, PlayerId, Symbol
+from .policies import MovePolicy
+
+# Coroutine that picks the next move of the player to move in `model`
+AsyncPlayer = Callable[[GridGameModel], Awaitable[Move]]
+
+
+@dataclass(frozen=True)
+class TurnStarted:
+    player: PlayerId
+    symbol_choices: list[Symbol]
+
+
+@dataclass(frozen=True)
+class MoveApplied:
+    player: PlayerId
+    symbol: Symbol
+    cell: Cell
+
+
+@dataclass(frozen=True)
+class MoveRejected:
+    player: PlayerId
+    symbol: Symbol
+    cell: Cell
+    feedback: Feedback
+
+
+@dataclass(frozen=True)
+class GameOver:
+    winner: PlayerId | None
+
+
+GameEvent = TurnStarted | MoveApplied | MoveRejected | GameOver
+
+GameListener = Callable[[GameEvent], None]
+
+
+class EventController:
+    """
+    Non-blocking controller: moves are pushed in as they arrive, and the
+    resulting state changes are pushed out to listeners as events.
+
+    Nothing here waits on a player, so any number of games can share one
+    thread. `play` drives a game from asyncio players, e.g. a
+    `QueuePlayer` fed by the network or a `policy_player` bot.
+    """
+
+    def __init__(self, model: GridGameModel) -> None:
+        self._model = model
+        self._listeners: list[GameListener] = []
+
+    @property
+    def model(self) -> GridGameModel:
+        return self._model
+
+    def subscribe(self, listener: GameListener) -> Callable[[], None]:
+        """Adds `listener` and returns a function that removes it."""
+        self._listeners.append(listener)
+
+        return lambda: self._listeners.remove(listener)
+
+    def _emit(self, event: GameEvent) -> None:
+        for listener in list(self._listeners):
+            listener(event)
+
+    def _emit_turn(self) -> None:
+        model = self._model
+
+        if model.is_game_over:
+            self._emit(GameOver(model.winner))
+        else:
+            player = model.current_player
+            self._emit(TurnStarted(player, model.get_symbol_choices(player)))
+
+    def start(self) -> None:
+        """Announces the player to move, or the result if the game is over."""
+        self._emit_turn()
+
+    def submit(self, symbol: Symbol, cell: Cell) -> Feedback:
+        """Plays a move for the player to move and emits what it changed."""
+        player = self._model.current_player
+        feedback = self._model.place_symbol(symbol, cell)
+
+        if feedback == Feedback.VALID:
+            self._emit(MoveApplied(player, symbol, cell))
+            self._emit_turn()
+        else:
+            self._emit(MoveRejected(player, symbol, cell, feedback))
+
+        return feedback
+
+    async def play(self, players: Mapping[PlayerId, AsyncPlayer]) -> PlayerId | None:
+        """
+        Plays the game to the end, awaiting each move from its player.
+
+        A player whose move is rejected is asked again.
+        """
+        model = self._model
+        self.start()
+
+        while not model.is_game_over:
+            symbol, cell = await players[model.current_player](model)
+            self.submit(symbol, cell)
+
+        return model.winner
+
+
+class QueuePlayer:
+    """Player whose moves are pushed in from elsewhere, e.g. a network client."""
+
+    def __init__(self) -> None:
+        self._moves: asyncio.Queue[Move] = asyncio.Queue()
+
+    def put(self, symbol: Symbol, cell: Cell) -> None:
+        self._moves.put_nowait((symbol, cell))
+
+    async def __call__(self, model: GridGameModel) -> Move:
+        return await self._moves.get()
+
+
+def policy_player(
+    policy: MovePolicy,
+    rng: random.Random,
+    ) -> AsyncPlayer:
+    """Wraps a synchronous move policy, e.g. `random_policy`, as a player."""
+    async def player(model: GridGameModel) -> Move:
+        # Lets other games on the event loop move in between
+        await asyncio.sleep(0)
+
+        return policy(model, rng)
+
+    return player
 
 
 class Controller:
@@ -11,39 +149,46 @@ class Controller:
     def start_game(self) -> None:
         model = self._model
         view = self._view
+        events = EventController(model)
+        events.subscribe(self._show)
+        events.start()
 
         while not model.is_game_over:
-            while True:
-                view.print_board(model.grid_size, model.occupied_cells)
-                view.print_current_player(model.current_player)
+            view.print_board(model.grid_size, model.occupied_cells)
+            view.print_current_player(model.current_player)
+
+            choices = model.get_symbol_choices(model.current_player)
+            assert len(choices) > 0
 
-                choices = model.get_symbol_choices(model.current_player)
-                assert len(choices) > 0
+            symbol = (
+                view.ask_for_symbol_choice(choices) if len(choices) > 1 else
+                choices[0]
+            )
 
-                symbol = (
-                    view.ask_for_symbol_choice(choices) if len(choices) > 1 else
-                    choices[0]
-                )
+            cell = view.ask_for_cell(model.grid_size)
 
-                cell = view.ask_for_cell(model.grid_size)
+            events.submit(symbol, cell)
 
-                match model.place_symbol(symbol, cell):
-                    case Feedback.VALID:
-                        break
+    def _show(self, event: GameEvent) -> None:
+        model = self._model
+        view = self._view
 
-                    case Feedback.OUT_OF_BOUNDS:
-                        view.print_error_out_of_bounds()
+        match event:
+            case MoveRejected(feedback=Feedback.OUT_OF_BOUNDS):
+                view.print_error_out_of_bounds()
 
-                    case Feedback.OCCUPIED:
-                        view.print_error_occupied()
+            case MoveRejected(feedback=Feedback.OCCUPIED):
+                view.print_error_occupied()
 
-                    case Feedback.GAME_OVER:
-                        view.print_error_game_over()
+            case MoveRejected(feedback=Feedback.GAME_OVER):
+                view.print_error_game_over()
 
-                    case Feedback.INVALID_SYMBOL:
-                        view.print_error_invalid_symbol()
+            case MoveRejected(feedback=Feedback.INVALID_SYMBOL):
+                view.print_error_invalid_symbol()
 
-                view.print_divider()
+            case GameOver(winner=winner):
+                view.print_board(model.grid_size, model.occupied_cells)
+                view.print_winner(winner)
 
-        view.print_board(model.grid_size, model.occupied_cells)
-        view.print_winner(model.winner)
+        if isinstance(event, MoveRejected):
+            view.print_divider()
@@ -0,0 +1,123 @@
+from collections.abc import Mapping, Sequence
+
+from .model import GridGameModel
+from .project_types import Cell, CellTable, Field, PlayerId, Symbol
+
+
+class StateCodec:
+    """
+    Packs a position into a fixed-width integer, and back.
+
+    Every cell is a base-k digit, k being the number of symbols plus one:
+    0 for an empty cell, i + 1 for `symbols[i]`. Cells are taken in
+    row-major order from the least significant digit, and the whole board
+    is then scaled by the player count to make room for the player to
+    move. A 3 x 3 two-player TicTacToe position fits in 16 bits
+    (3 ** 9 * 2 = 39366 states), i.e. 2 bytes.
+    """
+
+    def __init__(self,
+        grid_size: int,
+        symbols: Sequence[Symbol],
+        player_count: int,
+        ) -> None:
+
+        if len(set(symbols)) != len(symbols):
+            raise ValueError(f'Symbols must be distinct! (currently {symbols})')
+
+        if player_count < 1:
+            raise ValueError(f'Player count must be a positive integer! (currently {player_count})')
+
+        self._grid_size = grid_size
+        self._symbols = tuple(symbols)
+        self._codes = {symbol: code for code, symbol in enumerate(self._symbols, 1)}
+        self._player_count = player_count
+        self._base = len(self._symbols) + 1
+        self._cells = CellTable.of(grid_size).cells
+        self._state_count = player_count * self._base ** len(self._cells)
+        self._byte_length = max(1, ((self._state_count - 1).bit_length() + 7) // 8)
+
+    @classmethod
+    def for_model(cls, model: GridGameModel) -> 'StateCodec':
+        """Codec for every symbol any player of `model` may place."""
+        handler = model.symbol_and_player_handler
+        symbols = dict.fromkeys(
+            symbol
+            for player in range(1, model.player_count + 1)
+            for symbol in handler.get_symbol_choices(player)
+        )
+
+        return cls(model.grid_size, list(symbols), model.player_count)
+
+    @property
+    def symbols(self) -> tuple[Symbol, ...]:
+        return self._symbols
+
+    @property
+    def byte_length(self) -> int:
+        """Size of every state written by `to_bytes`."""
+        return self._byte_length
+
+    def encode(self, field: Field, current_player: PlayerId) -> int:
+        if field.grid_size != self._grid_size:
+            raise ValueError(
+                f'Field has grid size {field.grid_size}, codec expects {self._grid_size}')
+
+        return self._encode(field.occupied_cells, current_player)
+
+    def encode_model(self, model: GridGameModel) -> int:
+        if model.grid_size != self._grid_size:
+            raise ValueError(
+                f'Model has grid size {model.grid_size}, codec expects {self._grid_size}')
+
+        return self._encode(model.occupied_cells, model.current_player)
+
+    def _encode(self, occupied_cells: Mapping[Cell, Symbol], current_player: PlayerId) -> int:
+        if not 1 <= current_player <= self._player_count:
+            raise ValueError(
+                f'Current player must be between 1 and {self._player_count}! (currently {current_player})')
+
+        codes = self._codes
+        digits = [0] * len(self._cells)
+        for cell, symbol in occupied_cells.items():
+            if (code := codes.get(symbol)) is None:
+                raise ValueError(f'Symbol {symbol!r} is not one of {self._symbols}')
+            digits[(cell.row - 1) * self._grid_size + cell.col - 1] = code
+
+        board = 0
+        for digit in reversed(digits):
+            board = board * self._base + digit
+
+        return board * self._player_count + current_player - 1
+
+    def decode(self, state: int) -> tuple[dict[Cell, Symbol], PlayerId]:
+        """Occupied cells and player to move of an encoded state."""
+        if not 0 <= state < self._state_count:
+            raise ValueError(f'State {state} is out of range for this codec')
+
+        board, player_index = divmod(state, self._player_count)
+        symbols = self._symbols
+        base = self._base
+        occupied = {}
+
+        for cell in self._cells:
+            if not board:
+                break
+            board, digit = divmod(board, base)
+            if digit:
+                occupied[cell] = symbols[digit - 1]
+
+        return occupied, player_index + 1
+
+    def to_bytes(self, state: int) -> bytes:
+        return state.to_bytes(self._byte_length, 'little')
+
+    def from_bytes(self, data: bytes) -> int:
+        if len(data) != self._byte_length:
+            raise ValueError(f'Expected {self._byte_length} bytes (currently {len(data)})')
+
+        return int.from_bytes(data, 'little')
+
+    def restore(self, model: GridGameModel, state: int) -> None:
+        """Sets `model` to the position of an encoded state."""
+        model.set_position(*self.decode(state))
@@ -0,0 +1,239 @@
+import mmap
+import queue
+import struct
+import threading
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+from .model import GridGameModel
+from .project_types import Cell, CellTable, Feedback, PlayerId, Symbol
+
+
+# File layout, all little-endian:
+#   header: MAGIC, then a u8 format version
+#   record: u32 length of the rest of the record, then
+#           u8 + utf-8 variant, u16 grid size, u8 player count,
+#           u8 player symbol count, u8 symbol count, u8 + utf-8 per symbol,
+#           u32 move count, moves as (i16 row, i16 col, u8 symbol index, u8 feedback),
+#           u8 winner (0 for none)
+MAGIC = b'GGLOG'
+VERSION = 1
+
+_HEADER = MAGIC + bytes([VERSION])
+_LENGTH = struct.Struct('<I')
+_SETTINGS = struct.Struct('<HB')
+_COUNT = struct.Struct('<I')
+_MOVE = struct.Struct('<hhBB')
+
+# Feedback codes of format version 1; spelled out rather than taken from
+# `Feedback`'s auto() values so that reordering the enum keeps old logs
+# readable. New feedbacks get new codes, never reused ones.
+_FEEDBACK_CODES = {
+    Feedback.VALID: 1,
+    Feedback.OUT_OF_BOUNDS: 2,
+    Feedback.OCCUPIED: 3,
+    Feedback.INVALID_SYMBOL: 4,
+    Feedback.GAME_OVER: 5,
+}
+_FEEDBACKS = {code: feedback for feedback, code in _FEEDBACK_CODES.items()}
+
+
+@dataclass(frozen=True)
+class GameRecord:
+    variant: str
+    grid_size: int
+    player_count: int
+    player_symbols: tuple[Symbol, ...]
+    # Every attempted move in order, with the feedback the model gave
+    moves: tuple[tuple[Symbol, Cell, Feedback], ...]
+    winner: PlayerId | None
+
+
+class GameRecorder:
+    """
+    Plays moves on a model and remembers them for a `GameRecord`.
+
+    Use its `place_symbol` in place of the model's own.
+    """
+
+    def __init__(self,
+        model: GridGameModel,
+        variant: str,
+        player_symbols: Sequence[Symbol],
+        ) -> None:
+
+        self._model = model
+        self._variant = variant
+        self._player_symbols = tuple(player_symbols)
+        self._moves: list[tuple[Symbol, Cell, Feedback]] = []
+
+    @property
+    def model(self) -> GridGameModel:
+        return self._model
+
+    def place_symbol(self, symbol: Symbol, cell: Cell) -> Feedback:
+        feedback = self._model.place_symbol(symbol, cell)
+        self._moves.append((symbol, cell, feedback))
+
+        return feedback
+
+    def record(self) -> GameRecord:
+        return GameRecord(
+            variant=self._variant,
+            grid_size=self._model.grid_size,
+            player_count=self._model.player_count,
+            player_symbols=self._player_symbols,
+            moves=tuple(self._moves),
+            winner=self._model.winner,
+        )
+
+
+def _pack_text(text: str) -> bytes:
+    data = text.encode()
+    if len(data) > 255:
+        raise ValueError(f'Text is longer than 255 bytes: {text!r}')
+
+    return bytes([len(data)]) + data
+
+
+def encode_record(record: GameRecord) -> bytes:
+    # Symbols tried in invalid moves are stored after the player symbols
+    symbols = dict.fromkeys(record.player_symbols)
+    symbols.update(dict.fromkeys(symbol for symbol, _, _ in record.moves))
+    index = {symbol: k for k, symbol in enumerate(symbols)}
+
+    body = b''.join((
+        _pack_text(record.variant),
+        _SETTINGS.pack(record.grid_size, record.player_count),
+        bytes([len(record.player_symbols), len(symbols)]),
+        *(_pack_text(symbol) for symbol in symbols),
+        _COUNT.pack(len(record.moves)),
+        *(
+            _MOVE.pack(cell.row, cell.col, index[symbol], _FEEDBACK_CODES[feedback])
+            for symbol, cell, feedback in record.moves
+        ),
+        bytes([record.winner or 0]),
+    ))
+
+    return _LENGTH.pack(len(body)) + body
+
+
+def decode_record(data: memoryview | bytes) -> GameRecord:
+    """Record from the bytes following its length prefix."""
+    offset = 0
+
+    def text() -> str:
+        nonlocal offset
+        length = data[offset]
+        value = bytes(data[offset + 1:offset + 1 + length]).decode()
+        offset += 1 + length
+
+        return value
+
+    variant = text()
+    grid_size, player_count = _SETTINGS.unpack_from(data, offset)
+    offset += _SETTINGS.size
+    player_symbol_count, symbol_count = data[offset], data[offset + 1]
+    offset += 2
+    symbols = [text() for _ in range(symbol_count)]
+
+    (move_count,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    end = offset + move_count * _MOVE.size
+    cell = CellTable.of(grid_size).cell
+    moves = tuple(
+        (symbols[symbol], cell(row, col), _FEEDBACKS[feedback])
+        for row, col, symbol, feedback in _MOVE.iter_unpack(data[offset:end])
+    )
+
+    return GameRecord(
+        variant=variant,
+        grid_size=grid_size,
+        player_count=player_count,
+        player_symbols=tuple(symbols[:player_symbol_count]),
+        moves=moves,
+        winner=data[end] or None,
+    )
+
+
+class GameLogWriter:
+    """
+    Appends game records to a log file from a background thread.
+
+    `write` only queues the record, so game loops never wait on the disk.
+    `close` (or leaving the writer as a context manager) writes out
+    everything queued and re-raises any error the thread ran into.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, 'ab')
+        if self._file.tell() == 0:
+            self._file.write(_HEADER)
+
+        self._queue: queue.SimpleQueue[GameRecord | None] = queue.SimpleQueue()
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'GameLogWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, record: GameRecord) -> None:
+        if self._closed:
+            raise ValueError('Cannot write to a closed game log')
+
+        self._queue.put(record)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        while (record := self._queue.get()) is not None:
+            if self._error is not None:
+                continue
+
+            try:
+                self._file.write(encode_record(record))
+            except Exception as error:
+                self._error = error
+
+
+def read_games(path: str) -> Iterator[GameRecord]:
+    """
+    Lazily yields the games of a log file.
+
+    The file is memory-mapped, so only the record being decoded is read
+    into memory.
+    """
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped[:len(_HEADER)] != _HEADER:
+                raise ValueError(f'{path} is not a version {VERSION} game log')
+
+            view = memoryview(mapped)
+            offset = len(_HEADER)
+            try:
+                while offset < len(mapped):
+                    (length,) = _LENGTH.unpack_from(mapped, offset)
+                    offset += _LENGTH.size
+                    if offset + length > len(mapped):
+                        raise ValueError(f'{path} ends with a truncated record')
+
+                    yield decode_record(view[offset:offset + length])
+                    offset += length
+            finally:
+                view.release()
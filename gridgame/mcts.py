@@ -0,0 +1,334 @@
+import math
+import random
+import time
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from .model import (
+    GridGameModel,
+    GridGameSymbolAndPlayerHandler,
+    GridGameWinChecker,
+    InstrumentedWinChecker,
+    )
+from .project_types import Cell, Field, Move, PlayerId
+from .policies import random_policy, random_unoccupied_cell
+
+
+class _Node:
+    __slots__ = (
+        'move', 'parent', 'player', 'children', 'untried',
+        'visits', 'reward', 'is_terminal',
+    )
+
+    def __init__(self,
+        move: Move | None,
+        parent: '_Node | None',
+        player: PlayerId,
+        untried: list[Move],
+        is_terminal: bool,
+        ) -> None:
+        self.move = move
+        self.parent = parent
+        # Player who made `move`; rewards are from their point of view
+        self.player = player
+        self.children: list[_Node] = []
+        self.untried = untried
+        self.visits = 0
+        self.reward = 0.0
+        self.is_terminal = is_terminal
+
+
+class MCTSPlayer:
+    """
+    Monte Carlo Tree Search (UCT) move picker for any grid game variant.
+
+    Each search grows a tree from the current position of a
+    `GridGameModel` until the iteration budget or the wall-clock budget
+    (in seconds) runs out, whichever comes first. Leaves are scored with
+    uniformly random playouts on a private copy of the board; the model
+    itself is never changed. At least one iteration always runs. Winners
+    come from the model's win checker, so shared-symbol variants like
+    Notakto score correctly. A win counts 1 for the winner, a draw 0.5
+    for everyone.
+    """
+
+    def __init__(self,
+        iterations: int | None = None,
+        time_limit: float | None = None,
+        exploration: float = math.sqrt(2),
+        seed: int | None = None,
+        ) -> None:
+
+        if iterations is None and time_limit is None:
+            raise ValueError('MCTS needs an iteration budget, a time limit, or both')
+
+        if iterations is not None and iterations < 1:
+            raise ValueError(f'Iterations must be a positive integer! (currently {iterations})')
+
+        self._iterations = iterations
+        self._time_limit = time_limit
+        self._exploration = exploration
+        self._rng = random.Random(seed)
+        self._iterations_run = 0
+        # Position being searched, set up by `search`
+        self._handler: GridGameSymbolAndPlayerHandler | None = None
+        self._checker: GridGameWinChecker | None = None
+        self._field: Field | None = None
+
+    def choose_move(self, model: GridGameModel) -> Move:
+        visits = self.search(model)
+
+        return max(visits, key=visits.__getitem__)
+
+    def search(self, model: GridGameModel) -> dict[Move, int]:
+        """Grows a search tree from `model` and returns the visit count of each root move."""
+        if model.is_game_over:
+            raise ValueError('Cannot search a position where the game is over')
+
+        checker = model.win_checker
+        if isinstance(checker, InstrumentedWinChecker):
+            # The search is not part of the game being measured
+            checker = checker.wrapped
+
+        self._handler = model.symbol_and_player_handler
+        self._checker = checker
+        self._field = Field(model.grid_size)
+        for cell, symbol in model.occupied_cells.items():
+            self._field.place_symbol(symbol, cell)
+
+        root_player = model.current_player
+        root = _Node(
+            None, None, self._handler.prev_player(root_player),
+            self._moves(root_player), False,
+        )
+
+        deadline = (
+            None if self._time_limit is None else
+            time.perf_counter() + self._time_limit
+        )
+        iterations = 0
+
+        # At least one iteration, so that there is always a move to pick
+        # even when the time limit is already spent
+        while True:
+            self._iterate(root, root_player)
+            iterations += 1
+
+            if (
+                (self._iterations is not None and iterations >= self._iterations) or
+                (deadline is not None and time.perf_counter() >= deadline)
+            ):
+                break
+
+        self._iterations_run = iterations
+
+        return {child.move: child.visits for child in root.children}
+
+    @property
+    def iterations_run(self) -> int:
+        """Iterations completed by the last search."""
+        return self._iterations_run
+
+    def _moves(self, player: PlayerId) -> list[Move]:
+        return [
+            (symbol, cell)
+            for symbol in self._handler.get_symbol_choices(player)
+            for cell in self._field.unoccupied_cells
+        ]
+
+    def _play(self, move: Move, player: PlayerId, placed: list[Cell]) -> PlayerId | None:
+        """Applies `move` for `player` and returns the winner it produces, if any."""
+        symbol, cell = move
+        final_cell = self._handler.inquire_final_cell(cell, self._field)
+        self._field.place_symbol(symbol, final_cell)
+        placed.append(final_cell)
+
+        return self._checker.winner_at(
+            self._field, final_cell, self._handler.next_player(player))
+
+    def _iterate(self, root: _Node, root_player: PlayerId) -> None:
+        handler = self._handler
+        field = self._field
+        placed: list[Cell] = []
+
+        node = root
+        player = root_player
+        winner = None
+
+        # Selection
+        while not node.untried and node.children and not node.is_terminal:
+            node = self._select(node)
+            winner = self._play(node.move, player, placed)
+            player = handler.next_player(player)
+
+        # Expansion
+        if node.untried and not node.is_terminal:
+            move = node.untried.pop(self._rng.randrange(len(node.untried)))
+            winner = self._play(move, player, placed)
+            is_terminal = winner is not None or not field.has_unoccupied_cell()
+            child = _Node(
+                move, node, player,
+                [] if is_terminal else self._moves(handler.next_player(player)),
+                is_terminal,
+            )
+            node.children.append(child)
+            node = child
+            player = handler.next_player(player)
+
+        # Playout
+        if not node.is_terminal:
+            winner = self._playout(player, placed)
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            node.reward += (
+                0.5 if winner is None else
+                1.0 if winner == node.player else
+                0.0
+            )
+            node = node.parent
+
+        for cell in reversed(placed):
+            field.clear_cell(cell)
+
+    def _select(self, node: _Node) -> _Node:
+        log_visits = math.log(node.visits)
+        exploration = self._exploration
+
+        return max(
+            node.children,
+            key=lambda child: (
+                child.reward / child.visits +
+                exploration * math.sqrt(log_visits / child.visits)
+            ),
+        )
+
+    def _playout(self, player: PlayerId, placed: list[Cell]) -> PlayerId | None:
+        rng = self._rng
+        grid_size = self._field.grid_size
+        unoccupied = self._field.unoccupied_cells
+
+        while unoccupied:
+            symbol = rng.choice(self._handler.get_symbol_choices(player))
+            cell = random_unoccupied_cell(grid_size, unoccupied, rng)
+
+            if (winner := self._play((symbol, cell), player, placed)) is not None:
+                return winner
+
+            player = self._handler.next_player(player)
+
+        return None
+
+
+# Share of a parallel move's time budget the workers spend searching;
+# the rest is left for their results to come back to the parent
+_SEARCH_SHARE = 0.9
+
+
+def _search_worker(
+    model: GridGameModel,
+    iterations: int | None,
+    deadline: float | None,
+    exploration: float,
+    seed: int | None,
+    ) -> dict[Move, int]:
+    # `deadline` is wall-clock time, which all processes agree on
+    time_limit = None if deadline is None else max(0.0, deadline - time.time())
+
+    return MCTSPlayer(iterations, time_limit, exploration, seed).search(model)
+
+
+class ParallelMCTSPlayer:
+    """
+    Root-parallel MCTS over a pool of worker processes.
+
+    Every worker grows its own tree from the same position with its own
+    random seed, and the root visit counts of all trees are summed to pick
+    the move. The iteration budget applies to each worker. The time limit
+    covers the whole move, including starting the pool and shipping the
+    position to the workers; results that arrive late are left out, and a
+    random legal move is played if none arrive in time. The pool is
+    started on the first move and reused for later ones; call `close` (or
+    use the player as a context manager) to shut it down.
+    """
+
+    def __init__(self,
+        workers: int,
+        iterations: int | None = None,
+        time_limit: float | None = None,
+        exploration: float = math.sqrt(2),
+        seed: int | None = None,
+        ) -> None:
+
+        if workers < 1:
+            raise ValueError(f'Worker count must be a positive integer! (currently {workers})')
+
+        # Validates the budgets the same way each worker will
+        MCTSPlayer(iterations, time_limit, exploration)
+
+        self._workers = workers
+        self._iterations = iterations
+        self._time_limit = time_limit
+        self._exploration = exploration
+        self._rng = random.Random(seed)
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> 'ParallelMCTSPlayer':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def choose_move(self, model: GridGameModel) -> Move:
+        if not (visits := self.search(model)):
+            # No worker reported back; any legal move beats none
+            return random_policy(model, self._rng)
+
+        return max(visits, key=visits.__getitem__)
+
+    def search(self, model: GridGameModel) -> dict[Move, int]:
+        """Root visit counts merged over all workers."""
+        if model.is_game_over:
+            raise ValueError('Cannot search a position where the game is over')
+
+        start = time.time()
+        deadline = None if self._time_limit is None else start + self._time_limit
+        search_deadline = (
+            None if self._time_limit is None else
+            start + self._time_limit * _SEARCH_SHARE
+        )
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+
+        futures = [
+            self._executor.submit(
+                _search_worker,
+                model,
+                self._iterations,
+                search_deadline,
+                self._exploration,
+                self._rng.getrandbits(64),
+            )
+            for _ in range(self._workers)
+        ]
+
+        done, late = wait(
+            futures,
+            timeout=None if deadline is None else max(0.0, deadline - time.time()),
+        )
+        for future in late:
+            future.cancel()
+
+        visits: Counter[Move] = Counter()
+        for future in done:
+            visits.update(future.result())
+
+        return dict(visits)
@@ -1,5 +1,9 @@
-from copy import deepcopy
-from typing import Dict
+import copy
+import time
+
+from collections import Counter
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from .project_types import (
     Field,
@@ -7,9 +11,10 @@ from .project_types import (
     Cell,
     Symbol,
     Feedback,
+    LineTable,
     )
 
-from collections.abc import Sequence
+from collections.abc import KeysView, Sequence
 from abc import ABC, abstractmethod
 
 ####################################################################################################
@@ -47,21 +52,23 @@ class GridGameSymbolAndPlayerHandler(ABC):
     def inquire_final_cell(self, cell: Cell, field: Field) -> Cell:
         raise NotImplementedError
 
+    # Read-only views: callers cannot mutate handler state, and reads do not copy
+
     @property
-    def player_to_symbol(self) -> Dict[PlayerId, Symbol]:
-        return deepcopy(self._player_to_symbol)
+    def player_to_symbol(self) -> Mapping[PlayerId, Symbol]:
+        return MappingProxyType(self._player_to_symbol)
 
     @property
-    def symbol_to_player(self) -> Dict[Symbol, PlayerId]:
-        return deepcopy(self._symbol_to_player)
+    def symbol_to_player(self) -> Mapping[Symbol, PlayerId]:
+        return MappingProxyType(self._symbol_to_player)
 
     @property
     def player_symbol(self) -> Symbol:
-        return deepcopy(self._player_symbol)
+        return self._player_symbol
 
     @property
     def player_symbols(self) -> Sequence[Symbol]:
-        return deepcopy(self._player_symbols)
+        return self._player_symbols
 
     def next_player(self, current_player: PlayerId) -> PlayerId:
         return (
@@ -97,27 +104,32 @@ class GridGameWinChecker(ABC):
     def winner(self, field: Field, current_player: PlayerId) -> PlayerId | None:
         raise NotImplementedError
 
-    def _groups(self, field: Field) -> Sequence[list[list[Cell]]]:
+    @abstractmethod
+    def winner_by_completed_symbol(self,
+        symbol: Symbol,
+        current_player: PlayerId,
+        ) -> PlayerId | None:
+        raise NotImplementedError
 
-        row_groups = [
-            [Cell(row, k) for k in field.valid_coords]
-            for row in field.valid_coords
-        ]
+    def winner_at(self,
+        field: Field,
+        cell: Cell,
+        current_player: PlayerId,
+        ) -> PlayerId | None:
+        """
+        Winner decided by the symbol just placed at `cell`.
 
-        col_groups = [
-            [Cell(k, col) for k in field.valid_coords]
-            for col in field.valid_coords
-        ]
+        Only the row, column and diagonals through `cell` can have been
+        completed by that move, so only those lines are inspected.
+        """
+        if (basis := field.get_symbol_at(cell)) is None:
+            return None
 
-        diagonals = [
-            # Backslash
-            [Cell(k, k) for k in field.valid_coords],
-            # Forward slash
-            [Cell(k, field.grid_size - k + 1)
-             for k in field.valid_coords],
-        ]
+        for line in LineTable.of(field.grid_size).lines_through(cell):
+            if field.is_line_filled_with(basis, line):
+                return self.winner_by_completed_symbol(basis, current_player)
 
-        return row_groups, col_groups, diagonals
+        return None
 
 ####################################################################################################
 ####################################################################################################
@@ -142,6 +154,118 @@ class GridGameSettingInitializer(ABC):
 ####################################################################################################
 ####################################################################################################
 
+class GridGameStats:
+    """
+    Counters filled in by an instrumented model or win checker.
+
+    Pass an instance as `stats` to `GridGameModel`, or wrap a checker in
+    `InstrumentedWinChecker`, to record where time goes within a game.
+    A winner evaluation that scans the whole board counts every line.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.place_symbol_calls: Counter[Feedback] = Counter()
+        self.place_symbol_seconds = 0.0
+        self.winner_evaluations = 0
+        self.lines_scanned = 0
+        self.winner_seconds = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            'place_symbol_calls': {
+                feedback.name: self.place_symbol_calls[feedback]
+                for feedback in Feedback
+            },
+            'place_symbol_seconds': self.place_symbol_seconds,
+            'winner_evaluations': self.winner_evaluations,
+            'lines_scanned': self.lines_scanned,
+            'winner_seconds': self.winner_seconds,
+        }
+
+
+class _LineCountingField:
+    """Field stand-in that counts the lines a win checker inspects."""
+
+    __slots__ = ('_field', '_stats')
+
+    def __init__(self, field: Field, stats: GridGameStats) -> None:
+        self._field = field
+        self._stats = stats
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._field, name)
+
+    def is_line_filled_with(self, basis: Symbol, line: int) -> bool:
+        self._stats.lines_scanned += 1
+        return self._field.is_line_filled_with(basis, line)
+
+    def completed_line_symbol(self) -> Symbol | None:
+        self._stats.lines_scanned += len(LineTable.of(self._field.grid_size).lines)
+        return self._field.completed_line_symbol()
+
+
+class InstrumentedWinChecker(GridGameWinChecker):
+    """
+    Wraps a win checker and records its winner evaluations in `stats`.
+
+    Checkers are only wrapped when instrumentation is requested, so
+    uninstrumented games pay nothing for it.
+    """
+
+    def __init__(self,
+        win_checker: GridGameWinChecker,
+        stats: GridGameStats,
+        ) -> None:
+
+        super().__init__(win_checker.symbol_and_player_handler)
+        self._wrapped = win_checker
+        self._stats = stats
+
+    @property
+    def wrapped(self) -> GridGameWinChecker:
+        return self._wrapped
+
+    @property
+    def stats(self) -> GridGameStats:
+        return self._stats
+
+    def winner(self, field: Field, current_player: PlayerId) -> PlayerId | None:
+        start = time.perf_counter()
+        winner = self._wrapped.winner(_LineCountingField(field, self._stats), current_player)
+        self._record(start)
+
+        return winner
+
+    def winner_at(self,
+        field: Field,
+        cell: Cell,
+        current_player: PlayerId,
+        ) -> PlayerId | None:
+
+        start = time.perf_counter()
+        winner = self._wrapped.winner_at(
+            _LineCountingField(field, self._stats), cell, current_player)
+        self._record(start)
+
+        return winner
+
+    def winner_by_completed_symbol(self,
+        symbol: Symbol,
+        current_player: PlayerId,
+        ) -> PlayerId | None:
+        return self._wrapped.winner_by_completed_symbol(symbol, current_player)
+
+    def _record(self, start: float) -> None:
+        self._stats.winner_evaluations += 1
+        self._stats.winner_seconds += time.perf_counter() - start
+
+####################################################################################################
+####################################################################################################
+####################################################################################################
+
 class GridGameModel:
 
     def __init__(self,
@@ -151,11 +275,25 @@ class GridGameModel:
         symbol_and_player_handler: type[GridGameSymbolAndPlayerHandler],
         win_checker: type[GridGameWinChecker],
         setting_initializer: type[GridGameSettingInitializer],
+        field_type: type[Field] = Field,
+        stats: GridGameStats | None = None,
         ) -> None:
 
-        self._field = Field(grid_size)
+        self._field = field_type(grid_size)
+        # Bumped by every change to the board; `winner` and `is_game_over`
+        # are computed at most once per version
+        self._version = 0
+        self._last_cell: Cell | None = None
+        self._winner: PlayerId | None = None
+        self._winner_version = 0
+        self._is_game_over = False
+        self._is_game_over_version = -1
         self._player_count = player_count
         self._current_player: PlayerId = 1
+        # (cell, symbol, player who placed it) of every move still on the
+        # board, and of every undone move that can be redone
+        self._moves: list[tuple[Cell, Symbol, PlayerId]] = []
+        self._undone: list[tuple[Cell, Symbol, PlayerId]] = []
         self._player_symbols: Symbol | Sequence[Symbol] = player_symbols
 
         # self._symbol_and_player_handler: GridGameSymbolAndPlayerHandler = self._win_checker.symbol_and_player_handler
@@ -179,6 +317,12 @@ class GridGameModel:
         self._validate_player_symbols()
         self._validate_grid_size()
 
+        # Instrumentation wraps the win checker rather than checking a flag
+        # on every winner evaluation
+        self._stats = stats
+        if stats is not None:
+            self._win_checker = InstrumentedWinChecker(self._win_checker, stats)
+
     def get_symbol_choices(self, player: PlayerId) -> list[Symbol]:
         return self._symbol_and_player_handler.get_symbol_choices(player)
 
@@ -186,6 +330,20 @@ class GridGameModel:
         symbol: Symbol,
         cell: Cell) -> Feedback:
 
+        if self._stats is None:
+            return self._place_symbol(symbol, cell)
+
+        start = time.perf_counter()
+        feedback = self._place_symbol(symbol, cell)
+        self._stats.place_symbol_seconds += time.perf_counter() - start
+        self._stats.place_symbol_calls[feedback] += 1
+
+        return feedback
+
+    def _place_symbol(self,
+        symbol: Symbol,
+        cell: Cell) -> Feedback:
+
         if self.is_game_over:
             return Feedback.GAME_OVER
 
@@ -203,10 +361,90 @@ class GridGameModel:
         final_cell = self._symbol_and_player_handler.inquire_final_cell(cell, self._field)
 
         self._field.place_symbol(symbol, final_cell)
+        self._moves.append((final_cell, symbol, self._current_player))
+        self._undone.clear()
         self._switch_to_next_player()
+        self._last_cell = final_cell
+        self._version += 1
 
         return Feedback.VALID
 
+    def set_position(self,
+        occupied_cells: Mapping[Cell, Symbol],
+        current_player: PlayerId,
+        ) -> None:
+        """
+        Replaces the board and the player to move, e.g. with a decoded state.
+
+        The move history is not known for such a position, so it starts
+        empty and the winner is looked for over the whole board.
+        """
+        if not 1 <= current_player <= self._player_count:
+            raise ValueError(
+                f'Current player must be between 1 and {self._player_count}! (currently {current_player})')
+
+        field = type(self._field)(self.grid_size)
+        for cell, symbol in occupied_cells.items():
+            if not field.is_within_bounds(cell):
+                raise ValueError(f'Cell {cell} is out of bounds')
+            field.place_symbol(symbol, cell)
+
+        self._field = field
+        self._current_player = current_player
+        self._moves.clear()
+        self._undone.clear()
+        self._last_cell = None
+        self._version += 1
+        self._winner = self._win_checker.winner(field, current_player)
+        self._winner_version = self._version
+
+    def clone(self) -> 'GridGameModel':
+        """
+        Independent copy of the game in its current state.
+
+        The clone shares the handler, the win checker and any stats with
+        this model; the field is copied lazily on its first write.
+        """
+        clone = copy.copy(self)
+        clone._field = self._field.copy()
+        clone._moves = list(self._moves)
+        clone._undone = list(self._undone)
+
+        return clone
+
+    def undo(self) -> None:
+        """Takes back the last move, including one that ended the game."""
+        if not self._moves:
+            raise ValueError('There is no move to undo')
+
+        cell, symbol, player = move = self._moves.pop()
+        self._field.clear_cell(cell)
+        self._undone.append(move)
+        self._current_player = player
+        self._last_cell = self._moves[-1][0] if self._moves else None
+        self._version += 1
+
+    def redo(self) -> None:
+        """Replays the last undone move; any new move discards them."""
+        if not self._undone:
+            raise ValueError('There is no move to redo')
+
+        cell, symbol, player = move = self._undone.pop()
+        self._field.place_symbol(symbol, cell)
+        self._moves.append(move)
+        self._current_player = player
+        self._switch_to_next_player()
+        self._last_cell = cell
+        self._version += 1
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._moves)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._undone)
+
     def _validate_player_symbols(self) -> None:
         self._symbol_and_player_handler.validate_player_symbols()
 
@@ -218,9 +456,25 @@ class GridGameModel:
         # Game specific
         self._setting_initializer.validate_grid_size(self.grid_size)
 
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def stats(self) -> GridGameStats | None:
+        return self._stats
+
     @property
     def winner(self) -> PlayerId | None:
-        return self._win_checker.winner(self._field, self._current_player)
+        if self._winner_version != self._version:
+            self._winner = (
+                None if self._last_cell is None else
+                self._win_checker.winner_at(
+                    self._field, self._last_cell, self._current_player)
+            )
+            self._winner_version = self._version
+
+        return self._winner
 
     """
     what are the baseline factors needed to determine a winner?
@@ -263,19 +517,38 @@ class GridGameModel:
         self._symbol_and_player_handler.validate_player_count()
 
     @property
-    def occupied_cells(self) -> dict[Cell, Symbol]:
+    def symbol_and_player_handler(self) -> GridGameSymbolAndPlayerHandler:
+        return self._symbol_and_player_handler
+
+    @property
+    def win_checker(self) -> GridGameWinChecker:
+        return self._win_checker
+
+    @property
+    def occupied_cells(self) -> Mapping[Cell, Symbol]:
         return self._field.occupied_cells
 
+    @property
+    def unoccupied_cells(self) -> KeysView[Cell]:
+        return self._field.unoccupied_cells
+
+    def has_unoccupied_cell(self) -> bool:
+        return self._field.has_unoccupied_cell()
+
     @property
     def grid_size(self):
         return self._field.grid_size
 
     @property
     def is_game_over(self):
-        return (
-            self.winner is not None or
-            not self._field.has_unoccupied_cell()
-        )
+        if self._is_game_over_version != self._version:
+            self._is_game_over = (
+                self.winner is not None or
+                not self._field.has_unoccupied_cell()
+            )
+            self._is_game_over_version = self._version
+
+        return self._is_game_over
 
     @property
     def current_player(self) -> PlayerId:
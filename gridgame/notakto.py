@@ -1,5 +1,6 @@
 from .tictactoe import (
     # Project types:
+    Cell,
     Field,
     Symbol,
     PlayerId,
@@ -21,6 +22,7 @@ class NotaktoSymbolAndPlayerHandler(TicTacToeSymbolAndPlayerHandler):
         ) -> None:
 
         self._validate_player_symbol(player_symbols)
+        self._player_symbols: tuple[Symbol, ...] = tuple(player_symbols)
         self._player_symbol = player_symbols[0]
         self._player_count = player_count
 
@@ -32,6 +34,10 @@ class NotaktoSymbolAndPlayerHandler(TicTacToeSymbolAndPlayerHandler):
             raise ValueError(
                 f'Player symbols must be exactly 1 (was {player_symbol})')
 
+    def validate_player_symbols(self,
+        ) -> None:
+        self._validate_player_symbol(self._player_symbols)
+
     def get_symbol_choices(self, player: PlayerId) -> list[Symbol]:
         return [self._player_symbol]
 
@@ -46,14 +52,29 @@ class NotaktoSymbolAndPlayerHandler(TicTacToeSymbolAndPlayerHandler):
 class NotaktoWinChecker(TicTacToeWinChecker):
 
     def winner(self, field: Field, current_player: PlayerId) -> PlayerId | None:
-        for groups in self._groups(field):
-            for group in groups:
-                basis = self.symbol_and_player_handler.player_symbol
-                loser_player = self.symbol_and_player_handler.prev_player(current_player)
-                if field.are_all_equal_to_basis(basis, group):
-                    winner = self.symbol_and_player_handler.prev_player(loser_player)
-
-                    return winner
+        basis = self.symbol_and_player_handler.player_symbol
+        if field.completed_line_symbol() == basis:
+            return self.winner_by_completed_symbol(basis, current_player)
+
+        return None
+
+    def winner_at(self,
+        field: Field,
+        cell: Cell,
+        current_player: PlayerId,
+        ) -> PlayerId | None:
+        if field.get_symbol_at(cell) != self.symbol_and_player_handler.player_symbol:
+            return None
+
+        return super().winner_at(field, cell, current_player)
+
+    def winner_by_completed_symbol(self,
+        symbol: Symbol,
+        current_player: PlayerId,
+        ) -> PlayerId | None:
+        loser_player = self.symbol_and_player_handler.prev_player(current_player)
+
+        return self.symbol_and_player_handler.prev_player(loser_player)
 
 ####################################################################################################
 ####################################################################################################
@@ -0,0 +1,32 @@
+import random
+
+from collections.abc import Callable, Container
+
+from .model import GridGameModel
+from .project_types import Cell, CellTable, Move
+
+
+# Picks the next move for `model.current_player`; must be picklable
+# (e.g. a module-level function) to be used with several workers
+MovePolicy = Callable[[GridGameModel, random.Random], Move]
+
+
+def random_unoccupied_cell(
+    grid_size: int,
+    unoccupied: Container[Cell],
+    rng: random.Random,
+    ) -> Cell:
+    """Uniformly random cell of `unoccupied`, which must not be empty."""
+    # Rejection sampling over the flyweight table avoids copying the set
+    # of empty cells on every move
+    cells = CellTable.of(grid_size).cells
+    while (cell := cells[rng.randrange(len(cells))]) not in unoccupied:
+        pass
+
+    return cell
+
+
+def random_policy(model: GridGameModel, rng: random.Random) -> Move:
+    symbol = rng.choice(model.get_symbol_choices(model.current_player))
+
+    return symbol, random_unoccupied_cell(model.grid_size, model.unoccupied_cells, rng)
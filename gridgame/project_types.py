@@ -1,6 +1,10 @@
+import random
+import weakref
+
 from dataclasses import dataclass
 from enum import Enum, auto
-from collections.abc import Iterable
+from collections.abc import Iterable, KeysView, Mapping
+from types import MappingProxyType
 
 
 # Probably better as `typing.NewType('PlayerId', int)`
@@ -9,11 +13,92 @@ PlayerId = int
 Symbol = str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class Cell:
+    # The cached hash lives in a slot of its own rather than a field, so
+    # `fields` and `astuple` only see the coordinates
+    __slots__ = ('row', 'col', '_hash')
+
     row: int
     col: int
 
+    def __post_init__(self):
+        object.__setattr__(self, '_hash', hash((self.row, self.col)))
+
+    def __reduce__(self):
+        return Cell, (self.row, self.col)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+
+        if other.__class__ is not Cell:
+            return NotImplemented
+
+        return self.row == other.row and self.col == other.col
+
+
+# A symbol and the cell chosen for it
+Move = tuple[Symbol, Cell]
+
+
+class CellTable:
+    """
+    Flyweight `Cell`s of a square grid.
+
+    Get tables through `CellTable.of`; every table hands out the same
+    interned `Cell` object for a given (row, col), so code that walks the
+    grid does not allocate new cells.
+    """
+
+    _tables: dict[int, 'CellTable'] = {}
+    _interned: dict[tuple[int, int], Cell] = {}
+
+    @classmethod
+    def of(cls, grid_size: int) -> 'CellTable':
+        if (table := cls._tables.get(grid_size)) is None:
+            table = cls._tables[grid_size] = cls(grid_size)
+
+        return table
+
+    @classmethod
+    def intern(cls, row: int, col: int) -> Cell:
+        if (cell := cls._interned.get((row, col))) is None:
+            cell = cls._interned[row, col] = Cell(row, col)
+
+        return cell
+
+    def __init__(self, grid_size: int):
+        coords = range(1, grid_size + 1)
+
+        self._grid_size = grid_size
+        self._rows = tuple(
+            tuple(self.intern(row, col) for col in coords) for row in coords
+        )
+        self._cells = tuple(cell for row in self._rows for cell in row)
+
+    @property
+    def grid_size(self):
+        return self._grid_size
+
+    @property
+    def rows(self) -> tuple[tuple[Cell, ...], ...]:
+        return self._rows
+
+    @property
+    def cells(self) -> tuple[Cell, ...]:
+        """All cells in row-major order."""
+        return self._cells
+
+    def cell(self, row: int, col: int) -> Cell:
+        if 1 <= row <= self._grid_size and 1 <= col <= self._grid_size:
+            return self._rows[row - 1][col - 1]
+
+        return Cell(row, col)
+
 
 class Feedback(Enum):
     VALID = auto()
@@ -23,19 +108,199 @@ class Feedback(Enum):
     GAME_OVER = auto()
 
 
-class Field:
+class LineTable:
+    """
+    Row, column and diagonal cell groups of a square grid.
+
+    Tables are built once per grid size and shared; get them through
+    `LineTable.of`. Lines are numbered as rows (0 to n - 1), columns
+    (n to 2n - 1), the backslash diagonal (2n) and the forward slash
+    diagonal (2n + 1).
+    """
+
+    _tables: dict[int, 'LineTable'] = {}
+
+    @classmethod
+    def of(cls, grid_size: int) -> 'LineTable':
+        if (table := cls._tables.get(grid_size)) is None:
+            table = cls._tables[grid_size] = cls(grid_size)
+
+        return table
+
     def __init__(self, grid_size: int):
+        coords = range(1, grid_size + 1)
+        cell = CellTable.of(grid_size).cell
+
         self._grid_size = grid_size
-        self._valid_coords = list(range(1, self._grid_size + 1))
-        self._valid_cells = set(
-            Cell(r, c)
-            for r in self._valid_coords
-            for c in self._valid_coords
+        self._rows = tuple(
+            tuple(cell(row, k) for k in coords) for row in coords
+        )
+        self._cols = tuple(
+            tuple(cell(k, col) for k in coords) for col in coords
         )
-        self._grid: dict[Cell, Symbol | None] = {
-            cell: None for cell in self._valid_cells
+        self._diagonals = (
+            # Backslash
+            tuple(cell(k, k) for k in coords),
+            # Forward slash
+            tuple(cell(k, grid_size - k + 1) for k in coords),
+        )
+        self._lines = self._rows + self._cols + self._diagonals
+
+        lines_through: dict[Cell, list[int]] = {}
+        for index, line in enumerate(self._lines):
+            for cell in line:
+                lines_through.setdefault(cell, []).append(index)
+
+        self._lines_through = {
+            cell: tuple(indices) for cell, indices in lines_through.items()
         }
 
+    @property
+    def grid_size(self):
+        return self._grid_size
+
+    @property
+    def rows(self) -> tuple[tuple[Cell, ...], ...]:
+        return self._rows
+
+    @property
+    def cols(self) -> tuple[tuple[Cell, ...], ...]:
+        return self._cols
+
+    @property
+    def diagonals(self) -> tuple[tuple[Cell, ...], ...]:
+        return self._diagonals
+
+    @property
+    def lines(self) -> tuple[tuple[Cell, ...], ...]:
+        return self._lines
+
+    def lines_through(self, cell: Cell) -> tuple[int, ...]:
+        return self._lines_through[cell]
+
+
+class ZobristTable:
+    """
+    Random 64-bit keys for every (symbol, cell) of a square grid.
+
+    Keys are generated once per grid size and seed, and per symbol the
+    first time it is seen; get tables through `ZobristTable.of`. The
+    same seed always gives the same keys.
+    """
+
+    _tables: dict[tuple[int, int], 'ZobristTable'] = {}
+
+    @classmethod
+    def of(cls, grid_size: int, seed: int = 0) -> 'ZobristTable':
+        if (table := cls._tables.get((grid_size, seed))) is None:
+            table = cls._tables[grid_size, seed] = cls(grid_size, seed)
+
+        return table
+
+    def __init__(self, grid_size: int, seed: int = 0):
+        self._grid_size = grid_size
+        self._seed = seed
+        self._keys: dict[Symbol, tuple[int, ...]] = {}
+
+    def key(self, symbol: Symbol, cell: Cell) -> int:
+        if (keys := self._keys.get(symbol)) is None:
+            rng = random.Random(f'{self._seed}:{self._grid_size}:{symbol}')
+            keys = self._keys[symbol] = tuple(
+                rng.getrandbits(64)
+                for _ in range(self._grid_size * self._grid_size)
+            )
+
+        return keys[(cell.row - 1) * self._grid_size + cell.col - 1]
+
+
+class Field:
+    def __init__(self, grid_size: int, zobrist_seed: int = 0):
+        self._grid_size = grid_size
+        self._valid_coords = list(range(1, self._grid_size + 1))
+        self._cell_table = CellTable.of(grid_size)
+        self._valid_cells = set(self._cell_table.cells)
+        # Kept up to date by `place_symbol`; a dict keeps row-major order
+        self._unoccupied: dict[Cell, None] = dict.fromkeys(self._cell_table.cells)
+        self._zobrist = ZobristTable.of(grid_size, zobrist_seed)
+        self._zobrist_hash = 0
+        # Field whose storage this copy still borrows, and the live
+        # copies borrowing this field's storage
+        self._owner: Field | None = None
+        self._borrowers: weakref.WeakSet[Field] | None = None
+        self._init_storage()
+
+    def _init_storage(self):
+        self._grid: dict[Cell, Symbol] = {}
+        # Per-line, per-symbol counts, indexed as in `LineTable`
+        self._line_table = LineTable.of(self._grid_size)
+        self._line_counts: list[dict[Symbol, int]] = [
+            {} for _ in self._line_table.lines
+        ]
+
+    def _copy_storage(self):
+        self._grid = dict(self._grid)
+        self._line_counts = [dict(counts) for counts in self._line_counts]
+
+    def copy(self) -> 'Field':
+        """
+        Copy of the field that borrows its storage until either writes.
+
+        The field copied from keeps its storage, so views it handed out
+        stay live: its first write gives each copy still borrowing from it
+        a private copy first, and a copy's first write takes one for
+        itself. Views taken from a copy before either happens follow the
+        field it was copied from. Copies that are only read never copy
+        anything.
+        """
+        owner = self._owner or self
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._owner = owner
+        clone._borrowers = None
+
+        if owner._borrowers is None:
+            owner._borrowers = weakref.WeakSet()
+        owner._borrowers.add(clone)
+
+        return clone
+
+    def _own_storage(self):
+        if self._owner is not None:
+            self._owner._borrowers.discard(self)
+            self._owner = None
+            self._take_storage()
+
+        elif self._borrowers:
+            for borrower in list(self._borrowers):
+                borrower._owner = None
+                borrower._take_storage()
+            self._borrowers = None
+
+    def _take_storage(self):
+        self._unoccupied = dict(self._unoccupied)
+        self._copy_storage()
+
+    def __getstate__(self):
+        field = self
+        if self._owner is not None:
+            # Pickles on its own, without the field it borrows from
+            field = object.__new__(type(self))
+            field.__dict__.update(self.__dict__)
+            field._take_storage()
+
+        return {**field.__dict__, '_owner': None, '_borrowers': None}
+
+    def _mark_occupied(self, cell: Cell, symbol: Symbol, previous: Symbol | None):
+        self._unoccupied.pop(cell, None)
+
+        if previous is not None:
+            self._zobrist_hash ^= self._zobrist.key(previous, cell)
+        self._zobrist_hash ^= self._zobrist.key(symbol, cell)
+
+    def _mark_unoccupied(self, cell: Cell, previous: Symbol):
+        self._unoccupied[cell] = None
+        self._zobrist_hash ^= self._zobrist.key(previous, cell)
+
     @property
     def valid_coords(self):
         return list(self._valid_coords)
@@ -49,11 +314,22 @@ class Field:
         return self._grid_size
 
     @property
-    def occupied_cells(self) -> dict[Cell, Symbol]:
-        return {
-            cell: symbol for cell, symbol in self._grid.items()
-            if symbol is not None
-        }
+    def occupied_cells(self) -> Mapping[Cell, Symbol]:
+        return MappingProxyType(self._grid)
+
+    @property
+    def occupied_count(self) -> int:
+        return self._grid_size * self._grid_size - len(self._unoccupied)
+
+    @property
+    def zobrist_hash(self) -> int:
+        """64-bit Zobrist hash of the contents, kept up to date on every change."""
+        return self._zobrist_hash
+
+    @property
+    def unoccupied_cells(self) -> KeysView[Cell]:
+        """Live read-only view of the empty cells, i.e. the legal moves."""
+        return self._unoccupied.keys()
 
     def is_within_bounds(self, cell: Cell) -> bool:
         return (
@@ -63,17 +339,150 @@ class Field:
 
     def place_symbol(self, symbol: Symbol, cell: Cell):
         assert self.is_within_bounds(cell)
+        self._own_storage()
+
+        lines = self._line_table.lines_through(cell)
+        if (previous := self._grid.get(cell)) is not None:
+            for index in lines:
+                self._line_counts[index][previous] -= 1
 
         self._grid[cell] = symbol
+        for index in lines:
+            counts = self._line_counts[index]
+            counts[symbol] = counts.get(symbol, 0) + 1
+
+        self._mark_occupied(cell, symbol, previous)
+
+    def clear_cell(self, cell: Cell):
+        if cell not in self._grid:
+            return
+
+        self._own_storage()
+        previous = self._grid.pop(cell)
+
+        for index in self._line_table.lines_through(cell):
+            self._line_counts[index][previous] -= 1
+
+        self._mark_unoccupied(cell, previous)
 
     def get_symbol_at(self, cell: Cell) -> Symbol | None:
         return self._grid.get(cell)
 
     def has_unoccupied_cell(self):
-        return any(
-            True for cell in self.valid_cells
-            if self.get_symbol_at(cell) is None
-        )
+        return len(self._unoccupied) > 0
 
     def are_all_equal_to_basis(self, basis: Symbol, group: Iterable[Cell]):
         return all(self.get_symbol_at(cell) == basis for cell in group)
+
+    def is_line_filled_with(self, basis: Symbol, line: int) -> bool:
+        """Whether every cell of `LineTable` line number `line` holds `basis`."""
+        return self._line_counts[line].get(basis, 0) == self._grid_size
+
+    def completed_line_symbol(self) -> Symbol | None:
+        """The symbol filling the first complete line, in `LineTable` order."""
+        for index, line in enumerate(LineTable.of(self._grid_size).lines):
+            if (basis := self.get_symbol_at(line[0])) is not None and \
+                    self.is_line_filled_with(basis, index):
+                return basis
+
+        return None
+
+
+class BitboardField(Field):
+    """
+    `Field` that stores one occupancy bitmask per symbol.
+
+    Cell (r, c) is bit (r - 1) * n + (c - 1). Every line of the
+    `LineTable` has a precomputed mask, shared per grid size, so a line
+    check is a single bitwise and.
+    """
+
+    _line_masks: dict[int, tuple[int, ...]] = {}
+
+    def _init_storage(self):
+        self._occupied = 0
+        self._boards: dict[Symbol, int] = {}
+
+        grid_size = self._grid_size
+        if (masks := self._line_masks.get(grid_size)) is None:
+            masks = self._line_masks[grid_size] = tuple(
+                self._mask_of(line)
+                for line in LineTable.of(grid_size).lines
+            )
+        self._masks = masks
+
+    def _copy_storage(self):
+        self._boards = dict(self._boards)
+
+    def _bit(self, cell: Cell) -> int:
+        return 1 << ((cell.row - 1) * self._grid_size + cell.col - 1)
+
+    def _mask_of(self, group: Iterable[Cell]) -> int:
+        mask = 0
+        for cell in group:
+            mask |= self._bit(cell)
+
+        return mask
+
+    @property
+    def occupied_cells(self) -> Mapping[Cell, Symbol]:
+        return {
+            cell: symbol for cell in self._cell_table.cells
+            if (symbol := self.get_symbol_at(cell)) is not None
+        }
+
+    def place_symbol(self, symbol: Symbol, cell: Cell):
+        assert self.is_within_bounds(cell)
+        self._own_storage()
+
+        bit = self._bit(cell)
+        previous = self.get_symbol_at(cell)
+        if previous is not None:
+            self._boards[previous] &= ~bit
+
+        self._boards[symbol] = self._boards.get(symbol, 0) | bit
+        self._occupied |= bit
+        self._mark_occupied(cell, symbol, previous)
+
+    def clear_cell(self, cell: Cell):
+        if (previous := self.get_symbol_at(cell)) is None:
+            return
+
+        self._own_storage()
+        bit = self._bit(cell)
+        self._boards[previous] &= ~bit
+        self._occupied &= ~bit
+        self._mark_unoccupied(cell, previous)
+
+    def get_symbol_at(self, cell: Cell) -> Symbol | None:
+        if not self.is_within_bounds(cell):
+            return None
+
+        bit = self._bit(cell)
+        if self._occupied & bit:
+            for symbol, board in self._boards.items():
+                if board & bit:
+                    return symbol
+
+        return None
+
+    def are_all_equal_to_basis(self, basis: Symbol, group: Iterable[Cell]):
+        mask = self._mask_of(group)
+
+        return self._boards.get(basis, 0) & mask == mask
+
+    def is_line_filled_with(self, basis: Symbol, line: int) -> bool:
+        mask = self._masks[line]
+
+        return self._boards.get(basis, 0) & mask == mask
+
+    def completed_line_symbol(self) -> Symbol | None:
+        for mask in self._masks:
+            if self._occupied & mask != mask:
+                continue
+
+            for symbol, board in self._boards.items():
+                if board & mask == mask:
+                    return symbol
+
+        return None
@@ -0,0 +1,168 @@
+import argparse
+import time
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+
+from .gamelog import GameRecord, read_games
+from .model import GridGameModel
+from .project_types import Feedback, PlayerId
+from .variants import make_model
+
+
+# Builds a fresh model for the settings of a record; must be picklable
+# (e.g. a module-level function) to be used with several workers
+RecordModelFactory = Callable[[GameRecord], GridGameModel]
+
+
+def model_for_record(record: GameRecord, field: str = "dict") -> GridGameModel:
+    """Model built by `make_model`, like the CLI's, for the settings of `record`."""
+    return make_model(argparse.Namespace(
+        variant=record.variant,
+        size=record.grid_size,
+        player_count=record.player_count,
+        symbols=list(record.player_symbols),
+        field=field,
+    ))
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    # Position of the game in the replayed stream
+    game: int
+    # Index of the move in the record, or None for the winner
+    move: int | None
+    expected: Feedback | PlayerId | None
+    actual: Feedback | PlayerId | None
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    games: int
+    moves: int
+    mismatches: list[Mismatch]
+    seconds: float
+
+    @property
+    def is_consistent(self) -> bool:
+        return not self.mismatches
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds > 0 else 0.0
+
+
+def replay_game(
+    record: GameRecord,
+    model_factory: RecordModelFactory = model_for_record,
+    game: int = 0,
+    ) -> list[Mismatch]:
+    """Plays `record` on a fresh model and lists where the model disagrees with it."""
+    model = model_factory(record)
+    place_symbol = model.place_symbol
+    mismatches = []
+
+    for index, (symbol, cell, expected) in enumerate(record.moves):
+        if (actual := place_symbol(symbol, cell)) != expected:
+            mismatches.append(Mismatch(game, index, expected, actual))
+
+    if (winner := model.winner) != record.winner:
+        mismatches.append(Mismatch(game, None, record.winner, winner))
+
+    return mismatches
+
+
+def _replay_batch(
+    model_factory: RecordModelFactory,
+    first_game: int,
+    records: list[GameRecord],
+    ) -> tuple[int, list[Mismatch]]:
+    mismatches = []
+    for game, record in enumerate(records, first_game):
+        mismatches += replay_game(record, model_factory, game)
+
+    return sum(len(record.moves) for record in records), mismatches
+
+
+def _batches(records: Iterable[GameRecord], size: int) -> Iterator[tuple[int, list[GameRecord]]]:
+    records = iter(records)
+    first_game = 0
+
+    while batch := list(islice(records, size)):
+        yield first_game, batch
+        first_game += len(batch)
+
+
+def replay(
+    records: Iterable[GameRecord],
+    model_factory: RecordModelFactory = model_for_record,
+    workers: int = 1,
+    batch_size: int = 1000,
+    ) -> ReplayReport:
+    """
+    Replays every record through `GridGameModel.place_symbol` and checks
+    each stored feedback and winner against what the model now says.
+
+    Records are consumed lazily in batches of `batch_size` games spread
+    over `workers` processes, with only a few batches per worker in
+    flight, so arbitrarily large streams such as `read_games` fit in
+    memory.
+    """
+    if workers < 1:
+        raise ValueError(f'Worker count must be a positive integer! (currently {workers})')
+
+    if batch_size < 1:
+        raise ValueError(f'Batch size must be a positive integer! (currently {batch_size})')
+
+    games = 0
+    moves = 0
+    mismatches: list[Mismatch] = []
+    start = time.perf_counter()
+
+    if workers == 1:
+        for first_game, batch in _batches(records, batch_size):
+            batch_moves, batch_mismatches = _replay_batch(model_factory, first_game, batch)
+            games += len(batch)
+            moves += batch_moves
+            mismatches += batch_mismatches
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: deque[tuple[int, Future]] = deque()
+
+            def collect() -> None:
+                nonlocal games, moves
+                batch_games, future = pending.popleft()
+                batch_moves, batch_mismatches = future.result()
+                games += batch_games
+                moves += batch_moves
+                mismatches.extend(batch_mismatches)
+
+            for first_game, batch in _batches(records, batch_size):
+                if len(pending) >= 2 * workers:
+                    collect()
+                pending.append((
+                    len(batch),
+                    executor.submit(_replay_batch, model_factory, first_game, batch),
+                ))
+
+            while pending:
+                collect()
+
+    return ReplayReport(
+        games=games,
+        moves=moves,
+        mismatches=mismatches,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def replay_log(
+    path: str,
+    model_factory: RecordModelFactory = model_for_record,
+    workers: int = 1,
+    batch_size: int = 1000,
+    ) -> ReplayReport:
+    return replay(read_games(path), model_factory, workers, batch_size)
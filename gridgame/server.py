@@ -0,0 +1,233 @@
+import argparse
+import asyncio
+import json
+import secrets
+import time
+
+from collections.abc import Callable
+from typing import Any
+
+from .model import GridGameModel
+from .project_types import CellTable
+
+
+# Builds a model from settings shaped like the command-line arguments
+SettingsModelFactory = Callable[[argparse.Namespace], GridGameModel]
+
+# Request keys that override the server's default settings for a new game
+SETTINGS = ('variant', 'size', 'player_count', 'symbols', 'field')
+
+
+class RequestError(Exception):
+    pass
+
+
+class Session:
+    __slots__ = ('model', 'last_used')
+
+    def __init__(self, model: GridGameModel) -> None:
+        self.model = model
+        self.last_used = time.monotonic()
+
+
+class GameServer:
+    """
+    Hosts many concurrent games over a JSON-lines TCP protocol.
+
+    Every request is one JSON object on its own line, and gets exactly one
+    JSON line back, `{"ok": true, ...}` or `{"ok": false, "error": ...}`:
+
+    - `{"op": "new", "variant": ..., "size": ..., ...}` starts a game and
+      returns its `session` id; omitted settings fall back to the
+      server's defaults
+    - `{"op": "move", "session": ..., "symbol": ..., "row": ..., "col": ...}`
+      returns the `feedback` and the new state
+    - `{"op": "state", "session": ...}` returns the state and the board
+    - `{"op": "close", "session": ...}` ends a game
+
+    Sessions are not tied to a connection. Those left untouched for
+    `idle_timeout` seconds are evicted.
+    """
+
+    def __init__(self,
+        model_factory: SettingsModelFactory,
+        defaults: argparse.Namespace,
+        idle_timeout: float = 300.0,
+        max_sessions: int = 10000,
+        max_grid_size: int = 100,
+        ) -> None:
+
+        if idle_timeout <= 0:
+            raise ValueError(f'Idle timeout must be positive! (currently {idle_timeout})')
+
+        if max_sessions < 1:
+            raise ValueError(f'Session limit must be a positive integer! (currently {max_sessions})')
+
+        self._model_factory = model_factory
+        self._defaults = defaults
+        self._idle_timeout = idle_timeout
+        self._max_sessions = max_sessions
+        self._max_grid_size = max_grid_size
+        self._sessions: dict[str, Session] = {}
+        # Started with the server by `start`
+        self._evictor: asyncio.Task | None = None
+
+    @property
+    def session_count(self) -> int:
+        return len(self._sessions)
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765) -> asyncio.Server:
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        self._evictor = asyncio.create_task(self._evict_periodically())
+
+        return server
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8765) -> None:
+        server = await self.start(host, port)
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if self._evictor is not None:
+                self._evictor.cancel()
+
+    def evict_idle(self, now: float | None = None) -> int:
+        """Drops the sessions idle for longer than the timeout and returns how many."""
+        deadline = (time.monotonic() if now is None else now) - self._idle_timeout
+        idle = [
+            session_id for session_id, session in self._sessions.items()
+            if session.last_used < deadline
+        ]
+        for session_id in idle:
+            del self._sessions[session_id]
+
+        return len(idle)
+
+    async def _evict_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._idle_timeout / 2)
+            self.evict_idle()
+
+    async def _handle_connection(self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        ) -> None:
+
+        try:
+            while line := await reader.readline():
+                writer.write(self.handle_line(line))
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def handle_line(self, line: bytes) -> bytes:
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise RequestError('Requests must be JSON objects')
+            response = self.handle_request(request)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            response = {'ok': False, 'error': 'Requests must be JSON objects'}
+        except RequestError as error:
+            response = {'ok': False, 'error': str(error)}
+        except Exception as error:
+            # A bad request must not take the connection down with it
+            response = {'ok': False, 'error': f'Internal error: {error!r}'}
+
+        return json.dumps(response).encode() + b'\n'
+
+    def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        match request.get('op'):
+            case "new":
+                return self._new_game(request)
+
+            case "move":
+                return self._move(request)
+
+            case "state":
+                session_id, session = self._session(request)
+                return {'ok': True, 'session': session_id, **self._state(session.model, board=True)}
+
+            case "close":
+                session_id, _ = self._session(request)
+                del self._sessions[session_id]
+                return {'ok': True, 'session': session_id}
+
+            case op:
+                raise RequestError(f'Unknown op {op!r}')
+
+    def _new_game(self, request: dict[str, Any]) -> dict[str, Any]:
+        if len(self._sessions) >= self._max_sessions:
+            self.evict_idle()
+            if len(self._sessions) >= self._max_sessions:
+                raise RequestError('Too many open sessions')
+
+        settings = argparse.Namespace(**{
+            **vars(self._defaults),
+            **{key: request[key] for key in SETTINGS if key in request},
+        })
+
+        # Bounds the memory a single request can claim
+        if not isinstance(settings.size, int) or settings.size > self._max_grid_size:
+            raise RequestError(f'Size must be an integer up to {self._max_grid_size}')
+
+        try:
+            model = self._model_factory(settings)
+        except (ValueError, TypeError, NotImplementedError) as error:
+            raise RequestError(f'Cannot start game: {error}') from None
+
+        session_id = secrets.token_hex(8)
+        self._sessions[session_id] = Session(model)
+
+        return {'ok': True, 'session': session_id, **self._state(model)}
+
+    def _move(self, request: dict[str, Any]) -> dict[str, Any]:
+        session_id, session = self._session(request)
+        model = session.model
+
+        symbol, row, col = request.get('symbol'), request.get('row'), request.get('col')
+        if not isinstance(symbol, str):
+            raise RequestError('Symbol must be a string')
+        if not isinstance(row, int) or not isinstance(col, int):
+            raise RequestError('Row and col must be integers')
+
+        feedback = model.place_symbol(symbol, CellTable.of(model.grid_size).cell(row, col))
+
+        return {
+            'ok': True,
+            'session': session_id,
+            'feedback': feedback.name,
+            **self._state(model),
+        }
+
+    def _session(self, request: dict[str, Any]) -> tuple[str, Session]:
+        session_id = request.get('session')
+        if not isinstance(session_id, str):
+            raise RequestError('Session must be a string')
+        if (session := self._sessions.get(session_id)) is None:
+            raise RequestError(f'Unknown session {session_id!r}')
+
+        session.last_used = time.monotonic()
+
+        return session_id, session
+
+    def _state(self, model: GridGameModel, board: bool = False) -> dict[str, Any]:
+        state = {
+            'grid_size': model.grid_size,
+            'current_player': model.current_player,
+            'symbol_choices': model.get_symbol_choices(model.current_player),
+            'is_game_over': model.is_game_over,
+            'winner': model.winner,
+            'version': model.version,
+        }
+
+        if board:
+            state['board'] = [
+                [cell.row, cell.col, symbol]
+                for cell, symbol in model.occupied_cells.items()
+            ]
+
+        return state
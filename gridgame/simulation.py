@@ -0,0 +1,124 @@
+import random
+import time
+
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from .model import GridGameModel
+from .policies import MovePolicy, random_policy
+from .project_types import Feedback, PlayerId
+
+
+ModelFactory = Callable[[], GridGameModel]
+
+
+def play_game(
+    model: GridGameModel,
+    policy: MovePolicy,
+    rng: random.Random,
+    ) -> PlayerId | None:
+    """Plays `model` to the end with `policy` for every player and returns the winner."""
+    while not model.is_game_over:
+        symbol, cell = policy(model, rng)
+
+        if (feedback := model.place_symbol(symbol, cell)) != Feedback.VALID:
+            raise ValueError(
+                f'Policy chose an invalid move {symbol!r} at {cell} ({feedback.name})')
+
+    return model.winner
+
+
+@dataclass(frozen=True)
+class SimulationReport:
+    games: int
+    wins: dict[PlayerId, int]
+    draws: int
+    seconds: float
+
+    @property
+    def win_rates(self) -> dict[PlayerId, float]:
+        return {
+            player: wins / self.games
+            for player, wins in sorted(self.wins.items())
+        }
+
+    @property
+    def draw_rate(self) -> float:
+        return self.draws / self.games
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds > 0 else float('inf')
+
+
+def _play_batch(
+    model_factory: ModelFactory,
+    policy: MovePolicy,
+    games: int,
+    seed: int | None,
+    ) -> Counter[PlayerId | None]:
+    rng = random.Random(seed)
+
+    return Counter(
+        play_game(model_factory(), policy, rng)
+        for _ in range(games)
+    )
+
+
+def simulate(
+    model_factory: ModelFactory,
+    games: int,
+    workers: int = 1,
+    policy: MovePolicy = random_policy,
+    seed: int | None = None,
+    ) -> SimulationReport:
+    """
+    Plays `games` headless games of the models built by `model_factory`.
+
+    Games are split into batches spread over `workers` processes; with a
+    single worker everything runs in the calling process. A `seed` makes
+    the results reproducible for a given worker count.
+    """
+    if games < 1:
+        raise ValueError(f'Game count must be a positive integer! (currently {games})')
+
+    if workers < 1:
+        raise ValueError(f'Worker count must be a positive integer! (currently {workers})')
+
+    batch_count = min(games, workers * 4 if workers > 1 else 1)
+    batches = [
+        games // batch_count + (1 if k < games % batch_count else 0)
+        for k in range(batch_count)
+    ]
+    seeds = [
+        None if seed is None else seed * batch_count + k
+        for k in range(batch_count)
+    ]
+
+    start = time.perf_counter()
+
+    if workers == 1:
+        results = [_play_batch(model_factory, policy, batches[0], seeds[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                _play_batch,
+                [model_factory] * batch_count,
+                [policy] * batch_count,
+                batches,
+                seeds,
+            ))
+
+    seconds = time.perf_counter() - start
+
+    outcomes: Counter[PlayerId | None] = sum(results, Counter())
+    draws = outcomes.pop(None, 0)
+
+    return SimulationReport(
+        games=games,
+        wins=dict(outcomes),
+        draws=draws,
+        seconds=seconds,
+    )
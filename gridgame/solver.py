@@ -0,0 +1,200 @@
+from dataclasses import dataclass
+from enum import Enum, auto
+
+from .model import (
+    GridGameModel,
+    GridGameSymbolAndPlayerHandler,
+    GridGameWinChecker,
+    InstrumentedWinChecker,
+    )
+from .project_types import Field, Move, PlayerId
+from .symmetry import CanonicalHasher, Transform
+
+
+class Bound(Enum):
+    EXACT = auto()
+    LOWER = auto()
+    UPPER = auto()
+
+
+class SolverBudgetExceeded(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Solution:
+    # 1: the player to move wins, 0: draw, -1: the player to move loses
+    value: int
+    # None when the position is already over
+    best_move: Move | None
+
+
+class Solver:
+    """
+    Perfect-play solver for two-player grid games.
+
+    Runs negamax with alpha-beta pruning over a private copy of the
+    position and memoizes results in a transposition table keyed on the
+    player to move and the Zobrist hash of the board up to rotation and
+    reflection, kept up to date move by move. Winners are decided by the
+    model's own win checker, so variant rules such as Notakto's misère
+    condition are respected. The table is kept between calls to `solve`
+    for models sharing the same win checker.
+    """
+
+    def __init__(self, max_nodes: int | None = None) -> None:
+        self._max_nodes = max_nodes
+        self._table: dict[tuple[PlayerId, int], tuple[Bound, int, Move | None]] = {}
+        self._checker: GridGameWinChecker | None = None
+        self._nodes = 0
+        # Position being solved, set up by `solve`
+        self._handler: GridGameSymbolAndPlayerHandler | None = None
+        self._field: Field | None = None
+        self._hasher: CanonicalHasher | None = None
+
+    @property
+    def nodes(self) -> int:
+        """Positions searched by the last call to `solve`."""
+        return self._nodes
+
+    def solve(self, model: GridGameModel) -> Solution:
+        if model.player_count != 2:
+            raise ValueError(
+                f'Solver only supports two players (currently {model.player_count})')
+
+        player = model.current_player
+
+        if model.is_game_over:
+            winner = model.winner
+            value = 0 if winner is None else 1 if winner == player else -1
+
+            return Solution(value, None)
+
+        checker = model.win_checker
+        if isinstance(checker, InstrumentedWinChecker):
+            # The search is not part of the game being measured
+            checker = checker.wrapped
+
+        if checker is not self._checker:
+            # Positions of another game may score differently
+            self._table.clear()
+
+        self._handler = model.symbol_and_player_handler
+        self._checker = checker
+        self._field = Field(model.grid_size)
+        for cell, symbol in model.occupied_cells.items():
+            self._field.place_symbol(symbol, cell)
+        self._hasher = CanonicalHasher.of_field(self._field)
+        self._nodes = 0
+
+        value, move = self._negamax(player, -1, 1)
+
+        return Solution(value, move)
+
+    def _key(self, player: PlayerId) -> tuple[tuple[PlayerId, int], Transform]:
+        board_hash, transform = self._hasher.canonical()
+
+        return (player, board_hash), transform
+
+    def _transform(self, move: Move | None, transform: Transform) -> Move | None:
+        if move is None:
+            return None
+
+        symbol, cell = move
+        return symbol, transform.apply(cell, self._field.grid_size)
+
+    def _untransform(self, move: Move | None, transform: Transform) -> Move | None:
+        return self._transform(move, transform.inverse)
+
+    def _moves(self, player: PlayerId, first: Move | None) -> list[Move]:
+        moves = [
+            (symbol, cell)
+            for symbol in self._handler.get_symbol_choices(player)
+            for cell in self._field.unoccupied_cells
+        ]
+
+        if first is not None and first in moves:
+            moves.remove(first)
+            moves.insert(0, first)
+
+        return moves
+
+    def _negamax(self, player: PlayerId, alpha: int, beta: int) -> tuple[int, Move | None]:
+        """Value of the position for `player` to move: 1, 0 or -1."""
+        self._nodes += 1
+        if self._max_nodes is not None and self._nodes > self._max_nodes:
+            raise SolverBudgetExceeded(f'Searched more than {self._max_nodes} positions')
+
+        # Symmetric positions share one entry; moves are stored as played
+        # on the canonical board
+        key, transform = self._key(player)
+        original_alpha = alpha
+        first = None
+
+        if (entry := self._table.get(key)) is not None:
+            bound, score, first = entry
+            first = self._untransform(first, transform)
+            if bound == Bound.EXACT:
+                return score, first
+            if bound == Bound.LOWER:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if alpha >= beta:
+                return score, first
+
+        field = self._field
+        next_player = self._handler.next_player(player)
+        best_score = -2
+        best_move = None
+
+        # Settle every move that ends the game right away before searching
+        # deeper, so an immediate win cuts off the node at once
+        open_moves = []
+        for symbol, cell in self._moves(player, first):
+            final_cell = self._handler.inquire_final_cell(cell, field)
+            field.place_symbol(symbol, final_cell)
+
+            winner = self._checker.winner_at(field, final_cell, next_player)
+            if winner is not None:
+                score = 1 if winner == player else -1
+            elif not field.has_unoccupied_cell():
+                score = 0
+            else:
+                score = None
+                open_moves.append((symbol, cell, final_cell))
+
+            field.clear_cell(final_cell)
+
+            if score is not None and score > best_score:
+                best_score, best_move = score, (symbol, cell)
+                if score == 1:
+                    break
+
+        alpha = max(alpha, best_score)
+
+        for symbol, cell, final_cell in open_moves if alpha < beta else ():
+            field.place_symbol(symbol, final_cell)
+            self._hasher.toggle(symbol, final_cell)
+            score = -self._negamax(next_player, -beta, -alpha)[0]
+            self._hasher.toggle(symbol, final_cell)
+            field.clear_cell(final_cell)
+
+            if score > best_score:
+                best_score, best_move = score, (symbol, cell)
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        bound = (
+            Bound.UPPER if best_score <= original_alpha else
+            Bound.LOWER if best_score >= beta else
+            Bound.EXACT
+        )
+        self._table[key] = (bound, best_score, self._transform(best_move, transform))
+
+        return best_score, best_move
+
+
+def solve(model: GridGameModel, max_nodes: int | None = None) -> Solution:
+    return Solver(max_nodes).solve(model)
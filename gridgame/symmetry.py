@@ -0,0 +1,160 @@
+from enum import Enum
+
+from .project_types import Cell, CellTable, Field, Symbol, ZobristTable
+
+
+# Row-major cell contents of a board, with '' for empty cells so that
+# boards compare and sort
+BoardKey = tuple[Symbol, ...]
+
+
+class Transform(Enum):
+    """The eight rotations and reflections of a square grid."""
+
+    IDENTITY = 'identity'
+    ROTATE_90 = 'rotate_90'
+    ROTATE_180 = 'rotate_180'
+    ROTATE_270 = 'rotate_270'
+    MIRROR = 'mirror'
+    FLIP = 'flip'
+    TRANSPOSE = 'transpose'
+    ANTI_TRANSPOSE = 'anti_transpose'
+
+    def apply(self, cell: Cell, grid_size: int) -> Cell:
+        """Where `cell` ends up after transforming the board."""
+        row, col = self._map(cell.row - 1, cell.col - 1, grid_size - 1)
+
+        return CellTable.of(grid_size).cell(row + 1, col + 1)
+
+    def _map(self, row: int, col: int, last: int) -> tuple[int, int]:
+        match self:
+            case Transform.IDENTITY:
+                return row, col
+            case Transform.ROTATE_90:
+                # Clockwise
+                return col, last - row
+            case Transform.ROTATE_180:
+                return last - row, last - col
+            case Transform.ROTATE_270:
+                return last - col, row
+            case Transform.MIRROR:
+                # Left to right
+                return row, last - col
+            case Transform.FLIP:
+                # Top to bottom
+                return last - row, col
+            case Transform.TRANSPOSE:
+                return col, row
+            case Transform.ANTI_TRANSPOSE:
+                return last - col, last - row
+
+    @property
+    def inverse(self) -> 'Transform':
+        match self:
+            case Transform.ROTATE_90:
+                return Transform.ROTATE_270
+            case Transform.ROTATE_270:
+                return Transform.ROTATE_90
+            case _:
+                return self
+
+
+_permutations: dict[int, tuple[tuple[Transform, tuple[int, ...]], ...]] = {}
+
+
+def _permutations_of(grid_size: int) -> tuple[tuple[Transform, tuple[int, ...]], ...]:
+    """
+    For each transform, the row-major index of the source cell of every
+    cell of the transformed board.
+    """
+    if (permutations := _permutations.get(grid_size)) is None:
+        cells = CellTable.of(grid_size).cells
+        index = {cell: k for k, cell in enumerate(cells)}
+
+        permutations = _permutations[grid_size] = tuple(
+            (transform, tuple(
+                index[transform.inverse.apply(cell, grid_size)]
+                for cell in cells
+            ))
+            for transform in Transform
+        )
+
+    return permutations
+
+
+def board_key(field: Field) -> BoardKey:
+    get_symbol_at = field.get_symbol_at
+
+    return tuple(
+        get_symbol_at(cell) or ''
+        for cell in CellTable.of(field.grid_size).cells
+    )
+
+
+def canonicalize(field: Field) -> tuple[BoardKey, Transform]:
+    """
+    Canonical form of `field` under the symmetries of the square.
+
+    Returns the smallest transformed `BoardKey` and the transform that
+    produces it, so all up to eight equivalent positions share one key.
+    A cell `c` of the canonical board is `transform.inverse.apply(c, n)`
+    on `field`.
+    """
+    values = board_key(field)
+
+    return min(
+        (
+            (tuple(values[k] for k in permutation), transform)
+            for transform, permutation in _permutations_of(field.grid_size)
+        ),
+        key=lambda candidate: candidate[0],
+    )
+
+
+class CanonicalHasher:
+    """
+    Zobrist hashes of a board under all eight transforms.
+
+    `toggle` updates all of them for a symbol placed on or cleared from a
+    cell, so the smallest hash identifies the position up to symmetry
+    without walking the board. The `Transform.IDENTITY` hash equals
+    `Field.zobrist_hash` for the same seed.
+    """
+
+    def __init__(self, grid_size: int, seed: int = 0):
+        cells = CellTable.of(grid_size).cells
+
+        self._grid_size = grid_size
+        self._zobrist = ZobristTable.of(grid_size, seed)
+        self._transforms = tuple(Transform)
+        # Image of every cell, in row-major order, under each transform
+        self._images = tuple(
+            tuple(transform.apply(cell, grid_size) for cell in cells)
+            for transform in self._transforms
+        )
+        self._hashes = [0] * len(self._transforms)
+
+    @classmethod
+    def of_field(cls, field: Field, seed: int = 0) -> 'CanonicalHasher':
+        hasher = cls(field.grid_size, seed)
+        for cell, symbol in field.occupied_cells.items():
+            hasher.toggle(symbol, cell)
+
+        return hasher
+
+    def toggle(self, symbol: Symbol, cell: Cell) -> None:
+        index = (cell.row - 1) * self._grid_size + cell.col - 1
+        key = self._zobrist.key
+
+        for k, images in enumerate(self._images):
+            self._hashes[k] ^= key(symbol, images[index])
+
+    def hash_of(self, transform: Transform) -> int:
+        return self._hashes[self._transforms.index(transform)]
+
+    def canonical(self) -> tuple[int, Transform]:
+        """Smallest hash over all transforms, and the transform giving it."""
+        hashes = self._hashes
+        k = hashes.index(min(hashes))
+
+        return hashes[k], self._transforms[k]
@@ -23,9 +23,9 @@ class TicTacToeSymbolAndPlayerHandler(GridGameSymbolAndPlayerHandler):
         player_count: int
         ) -> None:
 
-        self._player_symbols = player_symbols
+        self._player_symbols: tuple[Symbol, ...] = tuple(player_symbols)
         self._player_count = player_count
-        self._validate_player_symbols()
+        self.validate_player_symbols()
 
         self._player_to_symbol: dict[PlayerId, Symbol] = {
             k: symbol
@@ -36,7 +36,7 @@ class TicTacToeSymbolAndPlayerHandler(GridGameSymbolAndPlayerHandler):
             for k, symbol in self._player_to_symbol.items()
         }
 
-    def _validate_player_count(self,
+    def validate_player_count(self,
         ) -> None:
         player_count = self._player_count
 
@@ -44,7 +44,7 @@ class TicTacToeSymbolAndPlayerHandler(GridGameSymbolAndPlayerHandler):
             raise ValueError(
             f'Must have at least two players (found {player_count})')
 
-    def _validate_player_symbols(self,
+    def validate_player_symbols(self,
         ) -> None:
 
         player_symbols: Sequence[Symbol] = self._player_symbols
@@ -76,17 +76,22 @@ class TicTacToeSymbolAndPlayerHandler(GridGameSymbolAndPlayerHandler):
 class TicTacToeWinChecker(GridGameWinChecker):
 
     def winner(self, field: Field, current_player: PlayerId) -> PlayerId | None:
-        for groups in self._groups(field):
-            for group in groups:
-                if (basis := field.get_symbol_at(group[0])) is not None and \
-                        field.are_all_equal_to_basis(basis, group):
-                    winner = self._symbol_and_player_handler.symbol_to_player.get(basis)
-                    assert winner is not None, \
-                        f'Winning symbol {basis} in cell group {groups} has no associated player'
-                    assert (player_symbol := self._symbol_and_player_handler.player_to_symbol[winner]) == basis, \
-                        f'Detected winning player {winner} with linked symbol {player_symbol} is not the same with current player {current_player}'
-
-                    return winner
+        if (basis := field.completed_line_symbol()) is not None:
+            return self.winner_by_completed_symbol(basis, current_player)
+
+        return None
+
+    def winner_by_completed_symbol(self,
+        symbol: Symbol,
+        current_player: PlayerId,
+        ) -> PlayerId | None:
+        winner = self._symbol_and_player_handler.symbol_to_player.get(symbol)
+        assert winner is not None, \
+            f'Winning symbol {symbol} has no associated player'
+        assert (player_symbol := self._symbol_and_player_handler.player_to_symbol[winner]) == symbol, \
+            f'Detected winning player {winner} with linked symbol {player_symbol} is not the same with current player {current_player}'
+
+        return winner
 
 ####################################################################################################
 ####################################################################################################
@@ -97,5 +102,5 @@ class TicTacToeSettingInitializer(GridGameSettingInitializer):
     def __init__(self, win_checker: TicTacToeWinChecker) -> None:
         self._win_checker: TicTacToeWinChecker = win_checker
 
-    def validate_grid_size_game_specific(self, grid_size: int) -> None:
+    def validate_grid_size(self, grid_size: int) -> None:
         pass
\ No newline at end of file
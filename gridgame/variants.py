@@ -0,0 +1,78 @@
+import argparse
+
+from .model import (
+    GridGameModel,
+    )
+
+from .project_types import (
+    Field,
+    BitboardField,
+    )
+
+from .tictactoe import (
+    TicTacToeSymbolAndPlayerHandler,
+    TicTacToeWinChecker,
+    TicTacToeSettingInitializer,
+    )
+
+from .notakto import (
+    NotaktoSettingInitializer,
+    NotaktoSymbolAndPlayerHandler,
+    NotaktoWinChecker,
+    )
+
+
+def make_model(args: argparse.Namespace):
+
+    size = args.size
+    player_count = args.player_count
+    player_symbols = args.symbols
+
+    match args.variant:
+        case "tictactoe":
+
+            symbol_and_player_handler = TicTacToeSymbolAndPlayerHandler
+            win_checker = TicTacToeWinChecker
+            gamemode = TicTacToeSettingInitializer
+
+        case "notakto":
+            # raise NotImplementedError('notakto variant is not yet implemented')
+            
+            symbol_and_player_handler = NotaktoSymbolAndPlayerHandler
+            win_checker = NotaktoWinChecker
+            gamemode = NotaktoSettingInitializer
+
+
+        case "wild":
+            raise NotImplementedError('wild variant is not yet implemented')
+
+        case "pick15":
+            raise NotImplementedError('pick15 variant is not yet implemented')
+
+        case _:
+            raise NotImplementedError(f'Variant "{args.variant}" is unknown')
+
+    match args.field:
+        case "dict":
+            field_type = Field
+
+        case "bitboard":
+            field_type = BitboardField
+
+        case "array":
+            # NumPy is optional; only needed for this backend
+            from .array_field import ArrayField
+            field_type = ArrayField
+
+        case _:
+            raise NotImplementedError(f'Field "{args.field}" is unknown')
+
+    return GridGameModel(
+        size,
+        player_symbols,
+        player_count,
+        symbol_and_player_handler,
+        win_checker,
+        gamemode,
+        field_type,
+        )
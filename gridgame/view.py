@@ -1,19 +1,66 @@
-from .project_types import Cell, PlayerId, Symbol
+from collections.abc import Mapping
 
+from .project_types import Cell, CellTable, PlayerId, Symbol
 
-class View:
-    def print_board(self, grid_size: int, occupied_cells: dict[Cell, Symbol]) -> None:
-        for r in range(1, grid_size + 1):
-            for c in range(1, grid_size + 1):
-                cell = Cell(r, c)
-                if (symbol := occupied_cells.get(cell)) is not None:
-                    print(symbol, end='\t')
-                else:
-                    print('_', end='\t')
 
-            print()
+# Cells are separated by tabs, so each starts on a multiple of this column
+_TAB_WIDTH = 8
+
 
-        print()
+class View:
+    def __init__(self) -> None:
+        # Grid size and contents of the last frame drawn by `redraw_board`
+        self._frame: tuple[int, dict[Cell, Symbol]] | None = None
+
+    def print_board(self, grid_size: int, occupied_cells: Mapping[Cell, Symbol]) -> None:
+        # Build the whole frame first and write it in one call
+        get = occupied_cells.get
+        frame = ''.join(
+            ''.join(f'{get(cell, "_")}\t' for cell in row) + '\n'
+            for row in CellTable.of(grid_size).rows
+        )
+
+        print(frame)
+
+    def redraw_board(self, grid_size: int, occupied_cells: Mapping[Cell, Symbol]) -> None:
+        """
+        Updates the board drawn by the previous call in place, rewriting
+        only the cells that changed since, using ANSI cursor movement.
+
+        Meant for terminals that show nothing but the board, e.g. a
+        spectator: anything else printed below the last frame throws the
+        cursor positions off. The first call, or one for another grid
+        size, prints a full frame.
+        """
+        if self._frame is None or self._frame[0] != grid_size:
+            self.print_board(grid_size, occupied_cells)
+            self._frame = grid_size, dict(occupied_cells)
+            return
+
+        previous = self._frame[1]
+        changes = {
+            cell: symbol for cell, symbol in occupied_cells.items()
+            if previous.get(cell) != symbol
+        }
+        changes.update({
+            cell: '_' for cell in previous
+            if cell not in occupied_cells
+        })
+
+        # The cursor rests below the blank line that ends the frame
+        updates = []
+        for cell, symbol in changes.items():
+            lines_up = grid_size + 2 - cell.row
+            column = (cell.col - 1) * _TAB_WIDTH + 1
+            updates.append(
+                f'\x1b[{lines_up}A\x1b[{column}G{symbol:<{_TAB_WIDTH - 1}}'
+                f'\x1b[{lines_up}B\r'
+            )
+
+        if updates:
+            print(''.join(updates), end='', flush=True)
+
+        self._frame = grid_size, dict(occupied_cells)
 
     def print_current_player(self, current_player: int) -> None:
         print(f'Turn of Player {current_player}')
@@ -44,7 +91,7 @@ class View:
                 col = int(input('Enter col: '))
 
                 if 1 <= row <= grid_size and 1 <= col <= grid_size:
-                    return Cell(row, col)
+                    return CellTable.of(grid_size).cell(row, col)
 
                 print(f'Coordinates must be within 1-{grid_size}. '
                       'Please try again.')
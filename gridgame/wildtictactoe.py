@@ -1,6 +1,7 @@
 from typing import Sequence
 from .tictactoe import (
     # Project types:
+    Cell,
     Field,
     Symbol,
     PlayerId,
@@ -21,7 +22,7 @@ class WildTicTacToeSymbolAndPlayerHandler(TicTacToeSymbolAndPlayerHandler):
         player_count: int
         ) -> None:
 
-        self._player_symbols = player_symbols
+        self._player_symbols: tuple[Symbol, ...] = tuple(player_symbols)
         self._player_count = player_count
         self._validate_player_symbols()
         self._validate_player_count()
@@ -68,17 +69,10 @@ class WildTicTacToeSymbolAndPlayerHandler(TicTacToeSymbolAndPlayerHandler):
 class WildTicTacToeWinChecker(TicTacToeWinChecker):
 
     def winner(self, field: Field, current_player: PlayerId) -> PlayerId | None:
-        for groups in self._groups(field):
-            for group in groups:
-                if (basis := field.get_symbol_at(group[0])) is not None and \
-                        field.are_all_equal_to_basis(basis, group):
-                    winner = self._symbol_and_player_handler.symbol_to_player.get(basis)
-                    assert winner is not None, \
-                        f'Winning symbol {basis} in cell group {groups} has no associated player'
-                    assert (player_symbol := self._symbol_and_player_handler.player_to_symbol[winner]) == basis, \
-                        f'Detected winning player {winner} with linked symbol {player_symbol} is not the same with current player {current_player}'
-
-                    return winner
+        if (basis := field.completed_line_symbol()) is not None:
+            return self.winner_by_completed_symbol(basis, current_player)
+
+        return None
 
 ####################################################################################################
 ####################################################################################################
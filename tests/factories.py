@@ -0,0 +1,33 @@
+from gridgame.model import GridGameModel
+
+from gridgame.notakto import (
+    NotaktoSymbolAndPlayerHandler,
+    NotaktoWinChecker,
+    NotaktoSettingInitializer,
+    )
+
+from gridgame.tictactoe import (
+    TicTacToeSymbolAndPlayerHandler,
+    TicTacToeWinChecker,
+    TicTacToeSettingInitializer,
+    )
+
+
+# Module-level so that they pickle, for tests that use worker processes
+
+def make_tictactoe(grid_size: int = 3, player_count: int = 2) -> GridGameModel:
+    return GridGameModel(grid_size=grid_size, player_count=player_count,
+                         player_symbols=['X', 'O', '*'][:player_count],
+            symbol_and_player_handler=TicTacToeSymbolAndPlayerHandler,
+            win_checker=TicTacToeWinChecker,
+            setting_initializer=TicTacToeSettingInitializer,
+            )
+
+
+def make_notakto(grid_size: int = 3, player_count: int = 2) -> GridGameModel:
+    return GridGameModel(grid_size=grid_size, player_count=player_count,
+                         player_symbols=['X'],
+            symbol_and_player_handler=NotaktoSymbolAndPlayerHandler,
+            win_checker=NotaktoWinChecker,
+            setting_initializer=NotaktoSettingInitializer,
+            )
@@ -0,0 +1,99 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from gridgame.model import (
+    GridGameModel,
+    Cell,
+    Feedback
+    )
+
+from gridgame.array_field import ArrayField
+
+from gridgame.project_types import Field, LineTable
+
+from gridgame.tictactoe import (
+    TicTacToeSymbolAndPlayerHandler,
+    TicTacToeWinChecker,
+    TicTacToeSettingInitializer,
+    )
+
+
+def test_has_unoccupied_cell_2():
+    field = ArrayField(2)
+    assert field.has_unoccupied_cell()
+
+    field.place_symbol('O', Cell(1, 1))
+    assert field.has_unoccupied_cell()
+    field.place_symbol('X', Cell(2, 2))
+    assert field.has_unoccupied_cell()
+    field.place_symbol('O', Cell(1, 2))
+    assert field.has_unoccupied_cell()
+    field.place_symbol('X', Cell(2, 1))
+    assert not field.has_unoccupied_cell()
+
+
+def test_get_symbol_at_3():
+    field = ArrayField(3)
+
+    field.place_symbol('O', Cell(1, 1))
+    field.place_symbol('X', Cell(2, 3))
+
+    assert field.get_symbol_at(Cell(1, 1)) == 'O'
+    assert field.get_symbol_at(Cell(2, 3)) == 'X'
+    assert field.get_symbol_at(Cell(3, 2)) is None
+    assert field.get_symbol_at(Cell(0, 1)) is None
+    assert field.occupied_cells == {Cell(1, 1): 'O', Cell(2, 3): 'X'}
+
+
+def test_completed_line_symbol_matches_field_50():
+    table = LineTable.of(50)
+
+    for line in table.lines:
+        field = ArrayField(50)
+        reference = Field(50)
+        for k, cell in enumerate(line):
+            symbol = 'X' if k < 49 else 'O'
+            field.place_symbol(symbol, cell)
+            reference.place_symbol(symbol, cell)
+
+        assert field.completed_line_symbol() is None
+        assert not field.are_all_equal_to_basis('X', line)
+
+        field.place_symbol('X', line[-1])
+        reference.place_symbol('X', line[-1])
+        assert field.completed_line_symbol() == 'X'
+        assert reference.completed_line_symbol() == 'X'
+        assert field.are_all_equal_to_basis('X', line)
+
+
+def test_get_winner_3_row_array():
+    model = GridGameModel(grid_size=3, player_count=2,
+                          player_symbols=['X', 'O'],
+            symbol_and_player_handler=TicTacToeSymbolAndPlayerHandler,
+            win_checker=TicTacToeWinChecker,
+            setting_initializer=TicTacToeSettingInitializer,
+            field_type=ArrayField,
+            )
+
+    model.place_symbol('X', Cell(2, 1))
+    model.place_symbol('O', Cell(1, 1))
+    model.place_symbol('X', Cell(2, 2))
+    model.place_symbol('O', Cell(3, 3))
+    assert model.place_symbol('X', Cell(2, 2)) == Feedback.OCCUPIED
+    assert model.winner is None
+    model.place_symbol('X', Cell(2, 3))
+    assert model.winner == 1
+    assert model.is_game_over
+
+
+def test_copy_on_write_3():
+    field = ArrayField(3)
+    field.place_symbol('O', Cell(1, 1))
+
+    copy = field.copy()
+    copy.place_symbol('X', Cell(2, 2))
+    field.clear_cell(Cell(1, 1))
+
+    assert copy.occupied_cells == {Cell(1, 1): 'O', Cell(2, 2): 'X'}
+    assert field.occupied_cells == {}
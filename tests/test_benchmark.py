@@ -0,0 +1,44 @@
+import pytest
+
+from gridgame.benchmark import (
+    OPERATIONS,
+    BenchmarkResult,
+    compare_results,
+    read_results,
+    run_benchmark,
+    write_results,
+    )
+
+from factories import make_tictactoe
+
+
+def test_run_benchmark_covers_every_operation():
+    results = run_benchmark('tictactoe', 4, make_tictactoe, repeat=2, field_calls=10)
+
+    assert [result.operation for result in results] == list(OPERATIONS)
+    assert all(result.variant == 'tictactoe' and result.grid_size == 4 for result in results)
+    assert all(result.calls > 0 and result.seconds_per_call >= 0 for result in results)
+
+
+def test_results_round_trip(tmp_path):
+    results = run_benchmark('tictactoe', 4, make_tictactoe, repeat=1, field_calls=10)
+    path = tmp_path / 'bench.json'
+
+    write_results(path, results)
+
+    assert read_results(path) == results
+
+
+def test_compare_results():
+    baseline = [
+        BenchmarkResult('tictactoe', 3, 'winner', 5, 2.0),
+        BenchmarkResult('tictactoe', 3, 'place_symbol', 5, 1.0),
+    ]
+    candidate = [
+        BenchmarkResult('tictactoe', 3, 'winner', 5, 1.0),
+        BenchmarkResult('notakto', 3, 'winner', 5, 1.0),
+    ]
+
+    rows = compare_results(baseline, candidate)
+
+    assert rows == [(baseline[0], candidate[0], pytest.approx(0.5))]
@@ -0,0 +1,116 @@
+import asyncio
+import random
+
+import pytest
+
+from gridgame.model import (
+    Cell,
+    Feedback,
+    )
+
+from gridgame.controller import (
+    Controller,
+    EventController,
+    GameOver,
+    MoveApplied,
+    MoveRejected,
+    QueuePlayer,
+    TurnStarted,
+    policy_player,
+    )
+from gridgame.policies import random_policy
+from gridgame.view import View
+
+from factories import make_tictactoe
+
+
+def test_events():
+    controller = EventController(make_tictactoe())
+    events = []
+    unsubscribe = controller.subscribe(events.append)
+
+    controller.start()
+    assert controller.submit('X', Cell(1, 1)) == Feedback.VALID
+    assert controller.submit('O', Cell(1, 1)) == Feedback.OCCUPIED
+    for symbol, cell in [
+        ('O', Cell(2, 2)), ('X', Cell(1, 2)), ('O', Cell(3, 3)), ('X', Cell(1, 3)),
+    ]:
+        controller.submit(symbol, cell)
+
+    assert events[:4] == [
+        TurnStarted(1, ['X']),
+        MoveApplied(1, 'X', Cell(1, 1)),
+        TurnStarted(2, ['O']),
+        MoveRejected(2, 'O', Cell(1, 1), Feedback.OCCUPIED),
+    ]
+    assert events[-2:] == [MoveApplied(1, 'X', Cell(1, 3)), GameOver(1)]
+
+    unsubscribe()
+    controller.submit('O', Cell(3, 1))
+    assert events[-1] == GameOver(1)
+
+
+def test_many_games_share_one_thread():
+    async def scenario():
+        rng = random.Random(0)
+        controllers = [EventController(make_tictactoe()) for _ in range(50)]
+
+        return await asyncio.gather(*(
+            controller.play({
+                1: policy_player(random_policy, rng),
+                2: policy_player(random_policy, rng),
+            })
+            for controller in controllers
+        )), controllers
+
+    winners, controllers = asyncio.run(scenario())
+    assert all(controller.model.is_game_over for controller in controllers)
+    assert winners == [controller.model.winner for controller in controllers]
+
+
+def test_queue_player():
+    async def scenario():
+        controller = EventController(make_tictactoe())
+        remote = QueuePlayer()
+        events = []
+        controller.subscribe(events.append)
+
+        game = asyncio.create_task(controller.play({
+            1: remote,
+            2: policy_player(lambda model, rng: ('O', Cell(2, 1 + len(model.occupied_cells) // 2)), None),
+        }))
+
+        for cell in [Cell(1, 1), Cell(1, 1), Cell(1, 2), Cell(1, 3)]:
+            await asyncio.sleep(0.01)
+            remote.put('X', cell)
+
+        return await game, events
+
+    winner, events = asyncio.run(scenario())
+    assert winner == 1
+    assert MoveRejected(1, 'X', Cell(1, 1), Feedback.OCCUPIED) in events
+
+
+def test_terminal_controller(monkeypatch, capsys):
+    answers = iter(['1', '1', '1', '1', '2', '2', '1', '2', '3', '3', '1', '3'])
+    monkeypatch.setattr('builtins.input', lambda prompt: next(answers))
+
+    model = make_tictactoe()
+    Controller(model, View()).start_game()
+
+    output = capsys.readouterr().out
+    assert 'cell is occupied' in output
+    assert output.count('-----') == 1
+    assert output.endswith('Player 1 wins!\n')
+
+
+def test_terminal_controller_on_finished_game(monkeypatch, capsys):
+    monkeypatch.setattr('builtins.input', lambda prompt: pytest.fail('asked for input'))
+
+    model = make_tictactoe()
+    model.set_position({Cell(1, 1): 'X', Cell(1, 2): 'X', Cell(1, 3): 'X', Cell(2, 1): 'O', Cell(2, 2): 'O'}, 2)
+    Controller(model, View()).start_game()
+
+    output = capsys.readouterr().out
+    assert output.count('wins!') == 1
+    assert output.endswith('Player 1 wins!\n')
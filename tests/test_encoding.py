@@ -0,0 +1,77 @@
+import random
+
+from functools import partial
+
+import pytest
+
+from gridgame.model import (
+    Cell,
+    )
+
+from gridgame.encoding import StateCodec
+from gridgame.project_types import Field
+from gridgame.policies import random_policy
+
+from factories import make_notakto, make_tictactoe
+
+
+def test_encode_small_states():
+    codec = StateCodec.for_model(make_tictactoe())
+    assert codec.symbols == ('X', 'O')
+    assert codec.byte_length == 2
+
+    field = Field(3)
+    assert codec.encode(field, 1) == 0
+    assert codec.encode(field, 2) == 1
+
+    # 'O' is digit 2 of the first cell, then doubled for the player
+    field.place_symbol('O', Cell(1, 1))
+    assert codec.encode(field, 1) == 4
+
+    field.place_symbol('X', Cell(3, 3))
+    state = codec.encode(field, 2)
+    assert state == (2 + 3 ** 8) * 2 + 1
+    assert codec.decode(state) == ({Cell(1, 1): 'O', Cell(3, 3): 'X'}, 2)
+    assert codec.from_bytes(codec.to_bytes(state)) == state
+
+
+def test_round_trip_random_games():
+    rng = random.Random(0)
+
+    for make_model in (make_tictactoe, partial(make_notakto, player_count=3), partial(make_tictactoe, 10)):
+        model = make_model()
+        codec = StateCodec.for_model(model)
+
+        while not model.is_game_over:
+            model.place_symbol(*random_policy(model, rng))
+
+            state = codec.encode_model(model)
+            restored = make_model()
+            codec.restore(restored, state)
+
+            assert dict(restored.occupied_cells) == dict(model.occupied_cells)
+            assert restored.current_player == model.current_player
+            assert restored.winner == model.winner
+            assert restored.is_game_over == model.is_game_over
+            assert codec.encode_model(restored) == state
+
+
+def test_invalid_states():
+    codec = StateCodec.for_model(make_tictactoe())
+    field = Field(3)
+
+    with pytest.raises(ValueError):
+        codec.encode(field, 3)
+
+    field.place_symbol('*', Cell(1, 1))
+    with pytest.raises(ValueError):
+        codec.encode(field, 1)
+
+    with pytest.raises(ValueError):
+        codec.decode(2 * 3 ** 9)
+
+    with pytest.raises(ValueError):
+        codec.from_bytes(b'\x00')
+
+    with pytest.raises(ValueError):
+        StateCodec(3, ['X', 'X'], 2)
@@ -1,4 +1,8 @@
-from gridgame.project_types import Field, Cell
+import pickle
+
+from dataclasses import astuple, fields
+
+from gridgame.project_types import Field, BitboardField, Cell, CellTable, LineTable, ZobristTable
 
 
 def test_is_valid_cell_initial_1():
@@ -121,3 +125,207 @@ def test_has_unoccupied_cell_3():
     assert field.has_unoccupied_cell()
     field.place_symbol('O', Cell(2, 3))
     assert not field.has_unoccupied_cell()
+
+
+def test_line_table_shared_3():
+    table = LineTable.of(3)
+    assert LineTable.of(3) is table
+    assert LineTable.of(4) is not table
+
+    assert table.rows[1] == (Cell(2, 1), Cell(2, 2), Cell(2, 3))
+    assert table.cols[2] == (Cell(1, 3), Cell(2, 3), Cell(3, 3))
+    assert table.diagonals == (
+        (Cell(1, 1), Cell(2, 2), Cell(3, 3)),
+        (Cell(1, 3), Cell(2, 2), Cell(3, 1)),
+    )
+    assert len(table.lines) == 8
+
+    assert table.lines_through(Cell(2, 2)) == (1, 4, 6, 7)
+    assert table.lines_through(Cell(1, 2)) == (0, 4)
+    assert table.lines_through(Cell(3, 1)) == (2, 3, 7)
+
+
+def test_bitboard_has_unoccupied_cell_2():
+    field = BitboardField(2)
+    assert field.has_unoccupied_cell()
+
+    field.place_symbol('O', Cell(1, 1))
+    assert field.has_unoccupied_cell()
+    field.place_symbol('X', Cell(2, 2))
+    assert field.has_unoccupied_cell()
+    field.place_symbol('O', Cell(1, 2))
+    assert field.has_unoccupied_cell()
+    field.place_symbol('X', Cell(2, 1))
+    assert not field.has_unoccupied_cell()
+
+
+def test_bitboard_get_symbol_at_3():
+    field = BitboardField(3)
+
+    field.place_symbol('O', Cell(1, 1))
+    field.place_symbol('X', Cell(2, 3))
+
+    assert field.get_symbol_at(Cell(1, 1)) == 'O'
+    assert field.get_symbol_at(Cell(2, 3)) == 'X'
+    assert field.get_symbol_at(Cell(3, 2)) is None
+    assert field.get_symbol_at(Cell(0, 1)) is None
+    assert field.get_symbol_at(Cell(4, 4)) is None
+    assert field.occupied_cells == {Cell(1, 1): 'O', Cell(2, 3): 'X'}
+
+    field.place_symbol('X', Cell(1, 1))
+    assert field.get_symbol_at(Cell(1, 1)) == 'X'
+
+
+def test_completed_line_symbol_3():
+    for field in (Field(3), BitboardField(3)):
+        assert field.completed_line_symbol() is None
+
+        field.place_symbol('X', Cell(1, 3))
+        field.place_symbol('O', Cell(1, 1))
+        field.place_symbol('X', Cell(2, 2))
+        field.place_symbol('O', Cell(2, 1))
+        assert field.completed_line_symbol() is None
+        assert not field.are_all_equal_to_basis('X', LineTable.of(3).diagonals[1])
+
+        field.place_symbol('X', Cell(3, 1))
+        assert field.completed_line_symbol() == 'X'
+        assert field.are_all_equal_to_basis('X', LineTable.of(3).diagonals[1])
+
+
+def test_unoccupied_cells_3():
+    for field in (Field(3), BitboardField(3)):
+        moves = field.unoccupied_cells
+        assert len(moves) == 9
+        assert field.occupied_count == 0
+
+        field.place_symbol('X', Cell(2, 2))
+        field.place_symbol('O', Cell(1, 3))
+        assert len(moves) == 7
+        assert Cell(2, 2) not in moves
+        assert Cell(1, 3) not in moves
+        assert Cell(1, 1) in moves
+        assert field.occupied_count == 2
+
+        field.place_symbol('X', Cell(1, 3))
+        assert len(moves) == 7
+        assert field.occupied_count == 2
+        assert dict(field.occupied_cells) == {Cell(2, 2): 'X', Cell(1, 3): 'X'}
+
+
+def test_cell_fields():
+    cell = Cell(2, 3)
+
+    assert [f.name for f in fields(cell)] == ['row', 'col']
+    assert astuple(cell) == (2, 3)
+    assert pickle.loads(pickle.dumps(cell)) == cell
+    assert hash(pickle.loads(pickle.dumps(cell))) == hash(cell)
+
+
+def test_cell_table_interned():
+    table = CellTable.of(3)
+    assert CellTable.of(3) is table
+
+    assert table.cell(2, 3) is table.cell(2, 3)
+    assert table.cell(2, 3) is CellTable.of(4).cell(2, 3)
+    assert table.cell(2, 3) == Cell(2, 3)
+    assert hash(table.cell(2, 3)) == hash(Cell(2, 3))
+    assert table.cell(2, 3) != Cell(3, 2)
+    assert table.cells == tuple(
+        Cell(r, c) for r in range(1, 4) for c in range(1, 4))
+
+    assert table.cell(0, 4) == Cell(0, 4)
+    assert LineTable.of(3).rows[1][2] is table.cell(2, 3)
+    assert next(iter(Field(3).unoccupied_cells)) is table.cell(1, 1)
+
+
+def test_zobrist_hash_3():
+    for field_type in (Field, BitboardField):
+        field = field_type(3)
+        other = field_type(3)
+        assert field.zobrist_hash == 0
+
+        field.place_symbol('X', Cell(1, 1))
+        field.place_symbol('O', Cell(2, 2))
+        first = field.zobrist_hash
+        assert first != 0
+
+        # Same contents in another order give the same hash
+        other.place_symbol('O', Cell(2, 2))
+        other.place_symbol('X', Cell(1, 1))
+        assert other.zobrist_hash == first
+
+        field.place_symbol('O', Cell(1, 1))
+        assert field.zobrist_hash != first
+        field.place_symbol('X', Cell(1, 1))
+        assert field.zobrist_hash == first
+
+        field.clear_cell(Cell(1, 1))
+        field.clear_cell(Cell(2, 2))
+        field.clear_cell(Cell(3, 3))
+        assert field.zobrist_hash == 0
+
+    assert Field(3, zobrist_seed=1).zobrist_hash == 0
+    assert ZobristTable.of(3, 1) is ZobristTable.of(3, 1)
+    assert ZobristTable.of(3, 1).key('X', Cell(1, 1)) != ZobristTable.of(3, 0).key('X', Cell(1, 1))
+
+
+def test_copy_on_write_3():
+    for field_type in (Field, BitboardField):
+        field = field_type(3)
+        field.place_symbol('X', Cell(1, 1))
+        field.place_symbol('X', Cell(1, 2))
+
+        copy = field.copy()
+        third = copy.copy()
+        assert dict(copy.occupied_cells) == dict(field.occupied_cells)
+
+        copy.place_symbol('X', Cell(1, 3))
+        assert copy.completed_line_symbol() == 'X'
+        assert field.completed_line_symbol() is None
+        assert field.get_symbol_at(Cell(1, 3)) is None
+        assert Cell(1, 3) in field.unoccupied_cells
+        assert Cell(1, 3) not in copy.unoccupied_cells
+        assert copy.zobrist_hash != field.zobrist_hash
+
+        field.clear_cell(Cell(1, 1))
+        assert field.occupied_count == 1
+        assert copy.get_symbol_at(Cell(1, 1)) == 'X'
+        assert third.get_symbol_at(Cell(1, 1)) == 'X'
+        assert third.occupied_count == 2
+
+        third.place_symbol('O', Cell(3, 3))
+        assert field.get_symbol_at(Cell(3, 3)) is None
+        assert copy.get_symbol_at(Cell(3, 3)) is None
+
+
+def test_copy_keeps_views_live_3():
+    for field_type in (Field, BitboardField):
+        for writer in ('original', 'copy'):
+            field = field_type(3)
+            moves = field.unoccupied_cells
+            occupied = field.occupied_cells
+
+            copy = field.copy()
+            if writer == 'copy':
+                copy.place_symbol('O', Cell(3, 3))
+            field.place_symbol('X', Cell(1, 1))
+
+            assert len(moves) == 8
+            assert Cell(1, 1) not in moves
+            assert Cell(3, 3) in moves
+            assert dict(field.occupied_cells) == {Cell(1, 1): 'X'}
+            if field_type is Field:
+                assert dict(occupied) == {Cell(1, 1): 'X'}
+            assert copy.get_symbol_at(Cell(1, 1)) is None
+
+
+def test_copy_pickles_on_its_own_3():
+    field = Field(3)
+    field.place_symbol('X', Cell(1, 1))
+    copy = field.copy()
+
+    restored = pickle.loads(pickle.dumps(copy))
+    restored.place_symbol('O', Cell(2, 2))
+    assert field.get_symbol_at(Cell(2, 2)) is None
+    assert len(field.unoccupied_cells) == 8
+    assert len(restored.unoccupied_cells) == 7
@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from gridgame.model import (
+    Cell,
+    Feedback,
+    )
+
+from gridgame.gamelog import (
+    GameLogWriter,
+    GameRecord,
+    GameRecorder,
+    encode_record,
+    read_games,
+    )
+from gridgame.policies import random_policy
+
+from factories import make_tictactoe
+
+
+def test_recorder():
+    recorder = GameRecorder(make_tictactoe(), 'tictactoe', ['X', 'O'])
+
+    assert recorder.place_symbol('X', Cell(1, 1)) == Feedback.VALID
+    assert recorder.place_symbol('X', Cell(2, 2)) == Feedback.INVALID_SYMBOL
+    assert recorder.place_symbol('O', Cell(0, 4)) == Feedback.OUT_OF_BOUNDS
+
+    assert recorder.record() == GameRecord(
+        variant='tictactoe',
+        grid_size=3,
+        player_count=2,
+        player_symbols=('X', 'O'),
+        moves=(
+            ('X', Cell(1, 1), Feedback.VALID),
+            ('X', Cell(2, 2), Feedback.INVALID_SYMBOL),
+            ('O', Cell(0, 4), Feedback.OUT_OF_BOUNDS),
+        ),
+        winner=None,
+    )
+
+
+def test_write_and_read_back(tmp_path):
+    path = tmp_path / 'games.log'
+    rng = random.Random(0)
+    records = []
+
+    with GameLogWriter(path) as writer:
+        for grid_size in (3, 3, 10):
+            recorder = GameRecorder(make_tictactoe(grid_size), 'tictactoe', ['X', 'O'])
+            recorder.place_symbol('*', Cell(1, 1))
+            while not recorder.model.is_game_over:
+                recorder.place_symbol(*random_policy(recorder.model, rng))
+
+            records.append(recorder.record())
+            writer.write(records[-1])
+
+    games = read_games(path)
+    assert next(games) == records[0]
+    assert list(games) == records[1:]
+
+    # Appending keeps the earlier games
+    with GameLogWriter(path) as writer:
+        writer.write(records[0])
+
+    assert list(read_games(path)) == records + records[:1]
+
+
+def test_feedback_codes():
+    # Part of format version 1, whatever the order of `Feedback`
+    feedbacks = [
+        Feedback.VALID,
+        Feedback.OUT_OF_BOUNDS,
+        Feedback.OCCUPIED,
+        Feedback.INVALID_SYMBOL,
+        Feedback.GAME_OVER,
+    ]
+    record = GameRecord('tictactoe', 3, 2, ('X', 'O'),
+        tuple(('X', Cell(1, 1), feedback) for feedback in feedbacks), None)
+
+    moves = encode_record(record)[-1 - 6 * len(feedbacks):-1]
+    assert list(moves[5::6]) == [1, 2, 3, 4, 5]
+
+
+def test_invalid_logs(tmp_path):
+    path = tmp_path / 'games.log'
+    path.write_bytes(b'not a log')
+    with pytest.raises(ValueError):
+        list(read_games(path))
+
+    record = GameRecord('tictactoe', 3, 2, ('X', 'O'), (), None)
+    with GameLogWriter(path := tmp_path / 'truncated.log') as writer:
+        writer.write(record)
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        list(read_games(path))
+
+    with pytest.raises(ValueError):
+        writer.write(record)
@@ -0,0 +1,140 @@
+import time
+
+import pytest
+
+from gridgame.model import (
+    GridGameModel,
+    GridGameStats,
+    Cell,
+    Feedback
+    )
+
+from gridgame.mcts import MCTSPlayer, ParallelMCTSPlayer
+from gridgame.tictactoe import (
+    TicTacToeSymbolAndPlayerHandler,
+    TicTacToeWinChecker,
+    TicTacToeSettingInitializer,
+    )
+
+from factories import make_notakto, make_tictactoe
+
+
+def play(model: GridGameModel, cells: list[Cell]) -> None:
+    for cell in cells:
+        symbol = model.get_symbol_choices(model.current_player)[0]
+        assert model.place_symbol(symbol, cell) == Feedback.VALID
+
+
+def test_takes_win():
+    model = make_tictactoe()
+    play(model, [Cell(1, 1), Cell(2, 1), Cell(1, 2), Cell(2, 2)])
+
+    assert MCTSPlayer(iterations=500, seed=1).choose_move(model) == ('X', Cell(1, 3))
+    # The model itself is left untouched
+    assert len(model.occupied_cells) == 4
+
+
+def test_blocks_loss():
+    model = make_tictactoe()
+    play(model, [Cell(1, 1), Cell(2, 2), Cell(1, 2)])
+
+    assert MCTSPlayer(iterations=2000, seed=2).choose_move(model) == ('O', Cell(1, 3))
+
+
+def test_notakto_avoids_completing_line():
+    model = make_notakto()
+    play(model, [Cell(1, 1), Cell(1, 2), Cell(3, 3), Cell(3, 2)])
+
+    # Playing (1, 3), (2, 2) or (3, 1) completes a line and loses
+    symbol, cell = MCTSPlayer(iterations=2000, seed=3).choose_move(model)
+    assert symbol == 'X'
+    assert cell not in (Cell(1, 3), Cell(2, 2), Cell(3, 1))
+
+
+def test_budgets():
+    model = make_tictactoe(6)
+
+    player = MCTSPlayer(iterations=50, seed=4)
+    visits = player.search(model)
+    assert player.iterations_run == 50
+    assert sum(visits.values()) == 50
+
+    player = MCTSPlayer(time_limit=0.05, seed=5)
+    symbol, cell = player.choose_move(model)
+    assert symbol == 'X'
+    assert cell in model.unoccupied_cells
+    assert player.iterations_run > 0
+
+    # An already spent time limit still yields a legal move
+    for time_limit in (0, 1e-9):
+        player = MCTSPlayer(time_limit=time_limit, seed=6)
+        symbol, cell = player.choose_move(model)
+        assert cell in model.unoccupied_cells
+        assert player.iterations_run == 1
+
+    with pytest.raises(ValueError):
+        MCTSPlayer()
+
+    with pytest.raises(ValueError):
+        MCTSPlayer(iterations=0)
+
+
+def test_game_over():
+    model = make_tictactoe()
+    play(model, [Cell(1, 1), Cell(2, 1), Cell(1, 2), Cell(2, 2), Cell(1, 3)])
+
+    with pytest.raises(ValueError):
+        MCTSPlayer(iterations=10).choose_move(model)
+
+
+def test_instrumented():
+    stats = GridGameStats()
+    model = GridGameModel(3, ['X', 'O'], 2,
+            TicTacToeSymbolAndPlayerHandler,
+            TicTacToeWinChecker,
+            TicTacToeSettingInitializer,
+            stats=stats,
+            )
+    assert not model.is_game_over
+    stats.reset()
+
+    # Playouts are not winner evaluations of the game itself
+    MCTSPlayer(iterations=50, seed=0).choose_move(model)
+    assert stats.winner_evaluations == 0
+    assert stats.lines_scanned == 0
+
+
+def test_parallel_takes_win():
+    model = make_tictactoe()
+    play(model, [Cell(1, 1), Cell(2, 1), Cell(1, 2), Cell(2, 2)])
+
+    with ParallelMCTSPlayer(workers=2, iterations=300, seed=6) as player:
+        visits = player.search(model)
+        assert sum(visits.values()) == 600
+        assert player.choose_move(model) == ('X', Cell(1, 3))
+
+        # The pool is reused across moves
+        executor = player._executor
+        play(model, [Cell(3, 3)])
+        assert player.choose_move(model) == ('O', Cell(2, 3))
+        assert player._executor is executor
+
+    assert player._executor is None
+
+    with pytest.raises(ValueError):
+        ParallelMCTSPlayer(workers=0, iterations=10)
+
+
+def test_parallel_time_limit():
+    model = make_tictactoe(6)
+
+    # The budget covers starting the pool on the first move
+    for time_limit in (0.5, 0.0):
+        with ParallelMCTSPlayer(workers=2, time_limit=time_limit, seed=7) as player:
+            start = time.perf_counter()
+            symbol, cell = player.choose_move(model)
+            assert time.perf_counter() - start < time_limit + 0.1
+            assert cell in model.unoccupied_cells
+
+    with pytest.raises(ValueError):
+        ParallelMCTSPlayer(workers=2)
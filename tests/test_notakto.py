@@ -0,0 +1,62 @@
+import pytest
+
+from gridgame.model import (
+    GridGameModel,
+    Cell,
+    Feedback
+    )
+
+from gridgame.notakto import (
+    NotaktoSymbolAndPlayerHandler,
+    NotaktoWinChecker,
+    NotaktoSettingInitializer,
+    )
+
+symbol_and_player_handler = NotaktoSymbolAndPlayerHandler
+win_checker = NotaktoWinChecker
+setting_initializer = NotaktoSettingInitializer
+
+
+def test_invalid_symbols_exception():
+    with pytest.raises(ValueError):
+        GridGameModel(grid_size=3, player_count=2, player_symbols=['X', 'O'],
+            symbol_and_player_handler=symbol_and_player_handler,
+            win_checker=win_checker,
+            setting_initializer=setting_initializer,
+            )
+
+
+def test_get_winner_3_backslash_2p():
+    model = GridGameModel(grid_size=3, player_count=2, player_symbols=['X'],
+            symbol_and_player_handler=symbol_and_player_handler,
+            win_checker=win_checker,
+            setting_initializer=setting_initializer,
+            )
+
+    assert model.place_symbol('X', Cell(1, 1)) == Feedback.VALID
+    assert model.winner is None
+    assert model.place_symbol('X', Cell(2, 2)) == Feedback.VALID
+    assert model.winner is None
+    assert model.place_symbol('X', Cell(1, 2)) == Feedback.VALID
+    assert model.winner is None
+    # Player 2 completes the diagonal and loses
+    assert model.place_symbol('X', Cell(3, 3)) == Feedback.VALID
+    assert model.winner == 1
+    assert model.is_game_over
+    assert model.place_symbol('X', Cell(1, 3)) == Feedback.GAME_OVER
+
+
+def test_get_winner_4_col_2p():
+    model = GridGameModel(grid_size=4, player_count=2, player_symbols=['X'],
+            symbol_and_player_handler=symbol_and_player_handler,
+            win_checker=win_checker,
+            setting_initializer=setting_initializer,
+            )
+
+    for row in range(1, 4):
+        model.place_symbol('X', Cell(row, 2))
+        assert model.winner is None
+
+    # Player 2 completes the column and loses
+    model.place_symbol('X', Cell(4, 2))
+    assert model.winner == 1
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from dataclasses import replace
+
+from gridgame.model import Cell, Feedback
+from gridgame.project_types import BitboardField
+
+from gridgame.gamelog import GameLogWriter, GameRecord, GameRecorder
+from gridgame.replay import (
+    Mismatch,
+    model_for_record,
+    replay,
+    replay_game,
+    replay_log,
+    )
+from gridgame.policies import random_policy
+
+
+def record_games(variant: str, count: int, seed: int = 0) -> list[GameRecord]:
+    rng = random.Random(seed)
+    symbols = ('X', 'O') if variant == 'tictactoe' else ('X',)
+    template = GameRecord(variant, 3, 2, symbols, (), None)
+    records = []
+
+    for _ in range(count):
+        recorder = GameRecorder(model_for_record(template), variant, symbols)
+        while not recorder.model.is_game_over:
+            recorder.place_symbol(*random_policy(recorder.model, rng))
+        recorder.place_symbol(symbols[0], Cell(1, 1))
+        records.append(recorder.record())
+
+    return records
+
+
+def test_replay_consistent_games():
+    records = record_games('tictactoe', 20) + record_games('notakto', 20)
+
+    report = replay(records, batch_size=7)
+    assert report.is_consistent
+    assert report.games == 40
+    assert report.moves == sum(len(record.moves) for record in records)
+
+
+def test_replay_reports_mismatches():
+    record = GameRecord(
+        'tictactoe', 3, 2, ('X', 'O'),
+        (
+            ('X', Cell(1, 1), Feedback.VALID),
+            ('O', Cell(1, 1), Feedback.VALID),
+            ('O', Cell(2, 2), Feedback.VALID),
+        ),
+        2,
+    )
+
+    assert replay_game(record, game=3) == [
+        Mismatch(3, 1, Feedback.VALID, Feedback.OCCUPIED),
+        Mismatch(3, None, 2, None),
+    ]
+
+
+def test_replay_log_with_workers(tmp_path):
+    path = tmp_path / 'games.log'
+    records = record_games('tictactoe', 30)
+    records[17] = replace(records[17], winner=None if records[17].winner else 1)
+
+    with GameLogWriter(path) as writer:
+        for record in records:
+            writer.write(record)
+
+    report = replay_log(path, workers=2, batch_size=4)
+    assert report.games == 30
+    assert [(m.game, m.move) for m in report.mismatches] == [(17, None)]
+
+
+def test_model_for_record():
+    record = GameRecord('notakto', 4, 3, ('X',), (), None)
+
+    model = model_for_record(record, field='bitboard')
+    assert (model.grid_size, model.player_count) == (4, 3)
+    assert isinstance(model._field, BitboardField)
+
+    with pytest.raises(NotImplementedError):
+        model_for_record(replace(record, variant='pick15'))
@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+import pytest
+
+from gridgame.__main__ import setup_parser
+from gridgame.server import GameServer, RequestError
+from gridgame.variants import make_model
+
+
+def make_server(**kwargs) -> GameServer:
+    defaults = setup_parser().parse_args(['serve', '--variant', 'tictactoe', '-s', 'X,O'])
+
+    return GameServer(make_model, defaults, **kwargs)
+
+
+def test_play_a_game():
+    server = make_server()
+
+    response = server.handle_request({'op': 'new'})
+    session = response['session']
+    assert response['current_player'] == 1
+    assert response['symbol_choices'] == ['X']
+    assert server.session_count == 1
+
+    for symbol, row, col in [('X', 1, 1), ('O', 2, 2), ('X', 1, 2), ('O', 3, 3)]:
+        response = server.handle_request(
+            {'op': 'move', 'session': session, 'symbol': symbol, 'row': row, 'col': col})
+        assert response['feedback'] == 'VALID'
+
+    response = server.handle_request(
+        {'op': 'move', 'session': session, 'symbol': 'X', 'row': 1, 'col': 1})
+    assert response['feedback'] == 'OCCUPIED'
+
+    response = server.handle_request(
+        {'op': 'move', 'session': session, 'symbol': 'X', 'row': 1, 'col': 3})
+    assert response['winner'] == 1
+    assert response['is_game_over']
+
+    response = server.handle_request({'op': 'state', 'session': session})
+    assert len(response['board']) == 5
+    assert [1, 3, 'X'] in response['board']
+
+    server.handle_request({'op': 'close', 'session': session})
+    assert server.session_count == 0
+
+
+def test_invalid_requests():
+    server = make_server(max_sessions=1)
+
+    with pytest.raises(RequestError):
+        server.handle_request({'op': 'fly'})
+    with pytest.raises(RequestError):
+        server.handle_request({'op': 'move', 'session': 'nope'})
+    with pytest.raises(RequestError):
+        server.handle_request({'op': 'new', 'symbols': ['X', 'X']})
+    with pytest.raises(RequestError):
+        server.handle_request({'op': 'new', 'size': 10 ** 6})
+
+    session = server.handle_request({'op': 'new', 'variant': 'notakto', 'symbols': ['X']})['session']
+    with pytest.raises(RequestError):
+        server.handle_request({'op': 'move', 'session': session, 'symbol': 'X', 'row': '1', 'col': 1})
+    with pytest.raises(RequestError):
+        server.handle_request({'op': 'new'})
+
+    assert json.loads(server.handle_line(b'[1, 2]\n')) == {
+        'ok': False, 'error': 'Requests must be JSON objects'}
+    assert json.loads(server.handle_line(b'{oops\n'))['ok'] is False
+
+    with pytest.raises(RequestError):
+        server.handle_request({'op': 'state', 'session': [1]})
+    assert json.loads(server.handle_line(b'{"op": "state", "session": [1]}\n')) == {
+        'ok': False, 'error': 'Session must be a string'}
+
+    def broken(request):
+        raise KeyError('boom')
+
+    server.handle_request = broken
+    assert json.loads(server.handle_line(b'{"op": "new"}\n'))['ok'] is False
+
+
+def test_evict_idle():
+    server = make_server(idle_timeout=10)
+    server.handle_request({'op': 'new'})
+    session = server.handle_request({'op': 'new'})['session']
+
+    assert server.evict_idle() == 0
+    server._sessions[session].last_used -= 20
+    assert server.evict_idle() == 1
+    assert server.session_count == 1
+
+
+def test_tcp_round_trip():
+    async def scenario():
+        server = make_server()
+        tcp_server = await server.start('127.0.0.1', 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+
+        async def request(reader, writer, payload):
+            writer.write(json.dumps(payload).encode() + b'\n')
+            await writer.drain()
+            return json.loads(await reader.readline())
+
+        clients = [await asyncio.open_connection('127.0.0.1', port) for _ in range(20)]
+        sessions = [await request(*client, {'op': 'new'}) for client in clients]
+        moves = await asyncio.gather(*(
+            request(*client, {
+                'op': 'move', 'session': session['session'],
+                'symbol': 'X', 'row': 2, 'col': 2,
+            })
+            for client, session in zip(clients, sessions)
+        ))
+
+        for _, writer in clients:
+            writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+
+        return server, moves
+
+    server, moves = asyncio.run(scenario())
+    assert all(move['feedback'] == 'VALID' for move in moves)
+    assert server.session_count == 20
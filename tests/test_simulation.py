@@ -0,0 +1,71 @@
+import pytest
+
+from functools import partial
+
+from gridgame.model import (
+    Cell,
+    )
+
+from gridgame.simulation import (
+    play_game,
+    random_policy,
+    simulate,
+    )
+
+from factories import make_notakto, make_tictactoe
+
+
+def first_empty_policy(model, rng):
+    symbol = model.get_symbol_choices(model.current_player)[0]
+
+    return symbol, next(iter(model.unoccupied_cells))
+
+
+def occupied_policy(model, rng):
+    return model.get_symbol_choices(model.current_player)[0], Cell(0, 0)
+
+
+def test_play_game_custom_policy():
+    model = make_tictactoe()
+
+    # Row-major filling: X completes the forward slash diagonal on move 7
+    assert play_game(model, first_empty_policy, None) == 1
+    assert len(model.occupied_cells) == 7
+
+
+def test_play_game_invalid_policy():
+    with pytest.raises(ValueError):
+        play_game(make_tictactoe(), occupied_policy, None)
+
+
+def test_simulate_single_worker():
+    report = simulate(make_tictactoe, games=200, seed=3)
+
+    assert report.games == 200
+    assert sum(report.wins.values()) + report.draws == 200
+    assert set(report.wins) <= {1, 2}
+    assert sum(report.win_rates.values()) + report.draw_rate == pytest.approx(1)
+    assert report.games_per_second > 0
+
+    again = simulate(make_tictactoe, games=200, seed=3)
+    assert (again.wins, again.draws) == (report.wins, report.draws)
+
+
+def test_simulate_workers():
+    report = simulate(partial(make_notakto, player_count=3), games=30, workers=2, seed=0)
+
+    assert report.games == 30
+    assert report.draws == 0
+    assert sum(report.wins.values()) == 30
+
+    report = simulate(partial(make_tictactoe, 10), games=5, workers=2,
+                      policy=random_policy)
+    assert sum(report.wins.values()) + report.draws == 5
+
+
+def test_simulate_invalid_counts():
+    with pytest.raises(ValueError):
+        simulate(make_tictactoe, games=0)
+
+    with pytest.raises(ValueError):
+        simulate(make_tictactoe, games=10, workers=0)
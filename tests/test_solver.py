@@ -0,0 +1,127 @@
+import copy
+import random
+
+import pytest
+
+from gridgame.model import (
+    GridGameModel,
+    GridGameStats,
+    Cell,
+    Feedback
+    )
+
+from gridgame.solver import (
+    Solver,
+    SolverBudgetExceeded,
+    solve,
+    )
+
+from gridgame.tictactoe import (
+    TicTacToeSymbolAndPlayerHandler,
+    TicTacToeWinChecker,
+    TicTacToeSettingInitializer,
+    )
+
+from factories import make_notakto, make_tictactoe
+
+
+def minimax(model: GridGameModel) -> int:
+    """Plain recursion through `place_symbol`, as a reference."""
+    player = model.current_player
+
+    if model.is_game_over:
+        winner = model.winner
+        return 0 if winner is None else 1 if winner == player else -1
+
+    best = -1
+    for cell in list(model.unoccupied_cells):
+        for symbol in model.get_symbol_choices(player):
+            child = copy.deepcopy(model)
+            assert child.place_symbol(symbol, cell) == Feedback.VALID
+            value = minimax(child)
+            value = value if child.current_player == player else -value
+            best = max(best, value)
+
+    return best
+
+
+def test_solve_initial_3():
+    assert solve(make_tictactoe()).value == 0
+    # First player wins 3x3 Notakto by taking the center
+    assert solve(make_notakto()).value == 1
+    assert solve(make_notakto()).best_move == ('X', Cell(2, 2))
+
+
+def test_solve_matches_minimax_3():
+    rng = random.Random(12)
+
+    for make in (make_tictactoe, make_notakto):
+        solver = Solver()
+        for _ in range(10):
+            model = make()
+            for _ in range(rng.randrange(3, 7)):
+                if model.is_game_over:
+                    break
+                symbol = model.get_symbol_choices(model.current_player)[0]
+                model.place_symbol(symbol, rng.choice(list(model.unoccupied_cells)))
+
+            solution = solver.solve(model)
+            assert solution.value == minimax(model)
+
+            if solution.best_move is None:
+                assert model.is_game_over
+                continue
+
+            # The best move keeps the value of the position
+            child = copy.deepcopy(model)
+            assert child.place_symbol(*solution.best_move) == Feedback.VALID
+            if child.is_game_over:
+                winner = child.winner
+                value = 0 if winner is None else 1 if winner == model.current_player else -1
+            else:
+                value = -solver.solve(child).value
+            assert value == solution.value
+
+
+def test_solve_game_over():
+    model = make_tictactoe()
+    for cell in [Cell(1, 1), Cell(2, 1), Cell(1, 2), Cell(2, 2), Cell(1, 3)]:
+        model.place_symbol(model.get_symbol_choices(model.current_player)[0], cell)
+
+    solution = solve(model)
+    assert solution.value == -1
+    assert solution.best_move is None
+
+
+def test_solve_notakto_4():
+    solver = Solver()
+    assert solver.solve(make_notakto(4)).value == -1
+    assert solver.nodes > 0
+
+
+def test_solve_budget():
+    with pytest.raises(SolverBudgetExceeded):
+        solve(make_tictactoe(4), max_nodes=1000)
+
+
+def test_solve_player_count():
+    with pytest.raises(ValueError):
+        solve(make_tictactoe(3, player_count=3))
+
+
+def test_solve_instrumented():
+    stats = GridGameStats()
+    model = GridGameModel(3, ['X', 'O'], 2,
+            TicTacToeSymbolAndPlayerHandler,
+            TicTacToeWinChecker,
+            TicTacToeSettingInitializer,
+            stats=stats,
+            )
+    model.place_symbol('X', Cell(2, 2))
+    assert not model.is_game_over
+    stats.reset()
+
+    # Positions searched are not winner evaluations of the game itself
+    assert solve(model).value == 0
+    assert stats.winner_evaluations == 0
+    assert stats.lines_scanned == 0
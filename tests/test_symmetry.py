@@ -0,0 +1,89 @@
+import random
+
+from gridgame.project_types import Field, Cell, CellTable
+from gridgame.symmetry import CanonicalHasher, Transform, board_key, canonicalize
+
+
+def transformed(field: Field, transform: Transform) -> Field:
+    result = Field(field.grid_size)
+    for cell, symbol in field.occupied_cells.items():
+        result.place_symbol(symbol, transform.apply(cell, field.grid_size))
+
+    return result
+
+
+def test_transform_apply_3():
+    assert Transform.IDENTITY.apply(Cell(1, 2), 3) == Cell(1, 2)
+    assert Transform.ROTATE_90.apply(Cell(1, 1), 3) == Cell(1, 3)
+    assert Transform.ROTATE_180.apply(Cell(1, 2), 3) == Cell(3, 2)
+    assert Transform.ROTATE_270.apply(Cell(1, 1), 3) == Cell(3, 1)
+    assert Transform.MIRROR.apply(Cell(2, 1), 3) == Cell(2, 3)
+    assert Transform.FLIP.apply(Cell(1, 2), 3) == Cell(3, 2)
+    assert Transform.TRANSPOSE.apply(Cell(1, 3), 3) == Cell(3, 1)
+    assert Transform.ANTI_TRANSPOSE.apply(Cell(1, 1), 3) == Cell(3, 3)
+    assert Transform.ROTATE_90.apply(Cell(2, 2), 3) is CellTable.of(3).cell(2, 2)
+
+
+def test_transform_inverse():
+    for grid_size in (2, 3, 4):
+        for transform in Transform:
+            images = set()
+            for cell in CellTable.of(grid_size).cells:
+                image = transform.apply(cell, grid_size)
+                images.add(image)
+                assert transform.inverse.apply(image, grid_size) == cell
+
+            assert images == set(CellTable.of(grid_size).cells)
+
+
+def test_canonicalize_equivalent_positions():
+    rng = random.Random(4)
+
+    for grid_size in (3, 4, 5):
+        for _ in range(10):
+            field = Field(grid_size)
+            cells = rng.sample(CellTable.of(grid_size).cells, rng.randrange(1, grid_size * 2))
+            for k, cell in enumerate(cells):
+                field.place_symbol('XO'[k % 2], cell)
+
+            canonical, transform = canonicalize(field)
+            assert board_key(transformed(field, transform)) == canonical
+
+            for other in Transform:
+                assert canonicalize(transformed(field, other))[0] == canonical
+
+
+def test_canonicalize_maps_moves_back():
+    field = Field(3)
+    field.place_symbol('X', Cell(1, 1))
+
+    canonical, transform = canonicalize(field)
+    assert canonical == ('', '', '', '', '', '', '', '', 'X')
+
+    # The occupied corner of the canonical board is the original (1, 1)
+    assert transform.inverse.apply(Cell(3, 3), 3) == Cell(1, 1)
+
+
+def test_canonical_hasher():
+    rng = random.Random(9)
+
+    for grid_size in (3, 4):
+        field = Field(grid_size)
+        cells = rng.sample(CellTable.of(grid_size).cells, grid_size + 1)
+        for k, cell in enumerate(cells):
+            field.place_symbol('XO'[k % 2], cell)
+
+        hasher = CanonicalHasher.of_field(field)
+        assert hasher.hash_of(Transform.IDENTITY) == field.zobrist_hash
+
+        canonical_hash, transform = hasher.canonical()
+        assert CanonicalHasher.of_field(transformed(field, transform)) \
+            .hash_of(Transform.IDENTITY) == canonical_hash
+
+        for other in Transform:
+            assert CanonicalHasher.of_field(transformed(field, other)).canonical()[0] == canonical_hash
+
+        hasher.toggle('X', cells[0])
+        assert hasher.canonical()[0] != canonical_hash
+        hasher.toggle('X', cells[0])
+        assert hasher.canonical()[0] == canonical_hash
@@ -2,10 +2,13 @@ import pytest
 
 from gridgame.model import (
     GridGameModel,
+    GridGameStats,
     Cell,
     Feedback
     )
 
+from gridgame.project_types import BitboardField, Field
+
 from gridgame.tictactoe import (
     TicTacToeSymbolAndPlayerHandler,
     TicTacToeWinChecker,
@@ -604,3 +607,262 @@ def test_grid_size():
             win_checker=win_checker,
             setting_initializer=setting_initializer,
             ).grid_size == 10
+
+
+def test_get_winner_5_forward_slash():
+    model = GridGameModel(grid_size=5, player_count=2,
+                          player_symbols=['X', 'O'],
+            symbol_and_player_handler=symbol_and_player_handler,
+            win_checker=win_checker,
+            setting_initializer=setting_initializer,
+            )
+
+    for k in range(1, 5):
+        model.place_symbol('X', Cell(k, 6 - k))
+        assert model.winner is None
+        model.place_symbol('O', Cell(k, k if k != 3 else 1))
+        assert model.winner is None
+
+    model.place_symbol('X', Cell(5, 1))
+    assert model.winner == 1
+    assert model.is_game_over
+
+
+def test_get_winner_3_col_bitboard():
+    model = GridGameModel(grid_size=3, player_count=2,
+                          player_symbols=['X', 'O'],
+            symbol_and_player_handler=symbol_and_player_handler,
+            win_checker=win_checker,
+            setting_initializer=setting_initializer,
+            field_type=BitboardField,
+            )
+
+    model.place_symbol('X', Cell(1, 2))
+    model.place_symbol('O', Cell(1, 1))
+    model.place_symbol('X', Cell(2, 2))
+    model.place_symbol('O', Cell(3, 3))
+    assert model.place_symbol('O', Cell(2, 2)) == Feedback.INVALID_SYMBOL
+    assert model.place_symbol('X', Cell(2, 2)) == Feedback.OCCUPIED
+    assert model.winner is None
+    model.place_symbol('X', Cell(3, 2))
+    assert model.winner == 1
+    assert model.occupied_cells == {
+        Cell(1, 2): 'X', Cell(1, 1): 'O', Cell(2, 2): 'X',
+        Cell(3, 3): 'O', Cell(3, 2): 'X',
+    }
+
+
+def test_handler_mappings_read_only():
+    handler = symbol_and_player_handler(player_symbols=['X', 'O'], player_count=2)
+
+    assert handler.player_to_symbol == {1: 'X', 2: 'O'}
+    assert handler.symbol_to_player == {'X': 1, 'O': 2}
+    assert tuple(handler.player_symbols) == ('X', 'O')
+
+    with pytest.raises(TypeError):
+        handler.player_to_symbol[1] = 'O'
+
+    with pytest.raises(TypeError):
+        handler.symbol_to_player['?'] = 3
+
+    with pytest.raises((TypeError, AttributeError)):
+        handler.player_symbols.append('?')
+
+    assert handler.get_symbol_choices(1) == ['X']
+
+
+def test_winner_at_100():
+    handler = symbol_and_player_handler(player_symbols=['X', 'O'], player_count=2)
+    checker = win_checker(handler)
+
+    for field in (Field(100), BitboardField(100)):
+        for k in range(1, 100):
+            field.place_symbol('O', Cell(k, 101 - k))
+            assert checker.winner_at(field, Cell(k, 101 - k), 1) is None
+
+        field.place_symbol('X', Cell(100, 1))
+        assert checker.winner_at(field, Cell(100, 1), 1) is None
+
+        field.place_symbol('O', Cell(100, 1))
+        assert checker.winner_at(field, Cell(100, 1), 1) == 2
+        assert checker.winner_at(field, Cell(50, 50), 1) is None
+        assert checker.winner(field, 1) == 2
+
+
+def test_winner_computed_once_per_version():
+    model = GridGameModel(grid_size=3, player_count=2,
+                          player_symbols=['X', 'O'],
+            symbol_and_player_handler=symbol_and_player_handler,
+            win_checker=win_checker,
+            setting_initializer=setting_initializer,
+            )
+    calls = []
+    checker = model._win_checker
+    winner_at = checker.winner_at
+
+    def counting_winner_at(*args):
+        calls.append(args)
+        return winner_at(*args)
+
+    checker.winner_at = counting_winner_at
+
+    assert model.version == 0
+    assert not model.is_game_over
+    assert calls == []
+
+    model.place_symbol('X', Cell(1, 1))
+    assert model.version == 1
+    assert model.winner is None
+    assert not model.is_game_over
+    assert model.winner is None
+    assert len(calls) == 1
+
+    assert model.place_symbol('X', Cell(2, 2)) == Feedback.INVALID_SYMBOL
+    assert model.version == 1
+    assert len(calls) == 1
+
+    model.place_symbol('O', Cell(2, 2))
+    model.place_symbol('X', Cell(1, 2))
+    model.place_symbol('O', Cell(3, 3))
+    model.place_symbol('X', Cell(1, 3))
+    assert model.winner == 1
+    assert model.place_symbol('O', Cell(3, 1)) == Feedback.GAME_OVER
+    assert model.is_game_over
+    assert model.winner == 1
+    assert len(calls) == 5
+
+
+def test_stats():
+    stats = GridGameStats()
+    model = GridGameModel(grid_size=3, player_count=2,
+                          player_symbols=['X', 'O'],
+            symbol_and_player_handler=symbol_and_player_handler,
+            win_checker=win_checker,
+            setting_initializer=setting_initializer,
+            stats=stats,
+            )
+    assert model.stats is stats
+
+    model.place_symbol('X', Cell(1, 1))
+    model.place_symbol('X', Cell(2, 2))
+    model.place_symbol('O', Cell(1, 1))
+    model.place_symbol('O', Cell(2, 2))
+    model.place_symbol('X', Cell(1, 2))
+    model.place_symbol('O', Cell(3, 3))
+    model.place_symbol('X', Cell(1, 3))
+    model.place_symbol('O', Cell(3, 1))
+    assert model.winner == 1
+
+    snapshot = stats.snapshot()
+    assert snapshot['place_symbol_calls'] == {
+        'VALID': 5,
+        'OUT_OF_BOUNDS': 0,
+        'OCCUPIED': 1,
+        'INVALID_SYMBOL': 1,
+        'GAME_OVER': 1,
+    }
+    # Once per move, as the result is cached until the board changes
+    assert snapshot['winner_evaluations'] == 5
+    # Three lines through a corner, four through the centre, two through an
+    # edge; the winning move completes the first line it checks
+    assert snapshot['lines_scanned'] == 3 + 4 + 2 + 3 + 1
+    assert snapshot['place_symbol_seconds'] > 0
+    assert snapshot['winner_seconds'] > 0
+
+    plain = GridGameModel(grid_size=3, player_count=2,
+                          player_symbols=['X', 'O'],
+            symbol_and_player_handler=symbol_and_player_handler,
+            win_checker=win_checker,
+            setting_initializer=setting_initializer,
+            )
+    assert plain.stats is None
+    assert 'place_symbol' not in vars(model)
+    assert 'place_symbol' not in vars(plain)
+
+
+def test_undo_redo():
+    model = GridGameModel(grid_size=3, player_count=2,
+                          player_symbols=['X', 'O'],
+            symbol_and_player_handler=symbol_and_player_handler,
+            win_checker=win_checker,
+            setting_initializer=setting_initializer,
+            )
+    assert not model.can_undo and not model.can_redo
+    with pytest.raises(ValueError):
+        model.undo()
+    with pytest.raises(ValueError):
+        model.redo()
+
+    for symbol, cell in [
+        ('X', Cell(1, 1)), ('O', Cell(2, 2)), ('X', Cell(1, 2)),
+        ('O', Cell(3, 3)), ('X', Cell(1, 3)),
+    ]:
+        model.place_symbol(symbol, cell)
+    assert model.winner == 1
+    assert model.is_game_over
+
+    model.undo()
+    assert model.winner is None
+    assert not model.is_game_over
+    assert model.current_player == 1
+    assert Cell(1, 3) not in model.occupied_cells
+    assert Cell(1, 3) in model.unoccupied_cells
+
+    model.undo()
+    assert model.current_player == 2
+    assert model.occupied_cells == {Cell(1, 1): 'X', Cell(2, 2): 'O', Cell(1, 2): 'X'}
+
+    model.redo()
+    model.redo()
+    assert not model.can_redo
+    assert model.winner == 1
+    assert model.current_player == 2
+
+    model.undo()
+    assert model.place_symbol('X', Cell(3, 1)) == Feedback.VALID
+    assert not model.can_redo
+    assert model.current_player == 2
+
+    while model.can_undo:
+        model.undo()
+    assert model.occupied_cells == {}
+    assert model.current_player == 1
+    assert model.winner is None
+
+
+def test_clone():
+    model = GridGameModel(grid_size=3, player_count=2,
+                          player_symbols=['X', 'O'],
+            symbol_and_player_handler=symbol_and_player_handler,
+            win_checker=win_checker,
+            setting_initializer=setting_initializer,
+            )
+    model.place_symbol('X', Cell(1, 1))
+    model.place_symbol('O', Cell(2, 2))
+    model.place_symbol('X', Cell(1, 2))
+
+    moves = model.unoccupied_cells
+    clone = model.clone()
+    assert clone.symbol_and_player_handler is model.symbol_and_player_handler
+    assert clone.win_checker is model.win_checker
+    assert clone.current_player == 2
+
+    clone.place_symbol('O', Cell(1, 3))
+    clone.place_symbol('X', Cell(3, 3))
+    assert clone.version == model.version + 2
+    assert model.current_player == 2
+    assert Cell(1, 3) not in model.occupied_cells
+
+    model.place_symbol('O', Cell(3, 1))
+    model.place_symbol('X', Cell(1, 3))
+    assert Cell(3, 1) not in moves
+    assert Cell(3, 1) not in model.unoccupied_cells
+    assert model.winner == 1
+    assert clone.winner is None
+    assert not clone.is_game_over
+
+    clone.undo()
+    clone.undo()
+    assert dict(clone.occupied_cells) == {
+        Cell(1, 1): 'X', Cell(2, 2): 'O', Cell(1, 2): 'X'}
+    assert model.can_undo
@@ -0,0 +1,27 @@
+from gridgame.model import Cell
+from gridgame.view import View
+
+
+def test_print_board(capsys):
+    View().print_board(2, {Cell(1, 2): 'X', Cell(2, 1): 'O'})
+
+    assert capsys.readouterr().out == '_\tX\t\nO\t_\t\n\n'
+
+
+def test_redraw_board(capsys):
+    view = View()
+    view.redraw_board(3, {Cell(1, 1): 'X'})
+    assert capsys.readouterr().out == 'X\t_\t_\t\n_\t_\t_\t\n_\t_\t_\t\n\n'
+
+    view.redraw_board(3, {Cell(1, 1): 'X'})
+    assert capsys.readouterr().out == ''
+
+    # Only the changed cells are rewritten, relative to the line below the frame
+    view.redraw_board(3, {Cell(1, 1): 'X', Cell(3, 2): 'O'})
+    assert capsys.readouterr().out == '\x1b[2A\x1b[9GO      \x1b[2B\r'
+
+    view.redraw_board(3, {Cell(3, 2): 'O'})
+    assert capsys.readouterr().out == '\x1b[4A\x1b[1G_      \x1b[4B\r'
+
+    view.redraw_board(2, {})
+    assert capsys.readouterr().out == '_\t_\t\n_\t_\t\n\n'